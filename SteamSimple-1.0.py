@@ -1,58 +1,1687 @@
-import sys, os, json, re, subprocess
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import QPropertyAnimation, QEasingCurve
+import time
+STARTUP_TIME = time.perf_counter()
+import sys, os, io, json, re, copy, mmap, struct, hashlib, threading, queue, unicodedata, atexit
+from collections import OrderedDict, deque
 
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_config.json")
+CONFIG_VERSION = 2
+# Les modifications rapprochées (options tapées au clavier, cases cochées) sont regroupées en une écriture
+CONFIG_SAVE_DELAY = 1.0
 STEAM_CONFIG_PATH = r"C:\Program Files (x86)\Steam\config\loginusers.vdf"
+STEAM_USERDATA_PATH = r"C:\Program Files (x86)\Steam\userdata"
+# Les dossiers de userdata portent l'identifiant de compte 32 bits : SteamID64 moins cette base
+STEAM_ID64_BASE = 76561197960265728
+LOCALCONFIG_APPS_SECTION = ("UserLocalConfigStore", "Software", "Valve", "Steam", "apps")
+LOCALCONFIG_WEBSTORAGE_SECTION = ("UserLocalConfigStore", "WebStorage")
+LIBRARY_INDEX_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_library.json")
+LIBRARY_INDEX_VERSION = 1
+LIBRARY_SNAPSHOT_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_snapshot.json")
+LIBRARY_SNAPSHOT_VERSION = 1
+STEAM_LIBRARY_FOLDERS_PATH = r"C:\Program Files (x86)\Steam\steamapps\libraryfolders.vdf"
+SCAN_MAX_WORKERS = 4
+# Un seul scan à la fois par disque pour ne pas faire travailler les têtes des HDD
+SCAN_THREADS_PER_DEVICE = 1
+SCAN_BATCH_SIZE = 24
+SCAN_BATCH_INTERVAL = 0.1
+SEARCH_DEBOUNCE_MS = 120
+SEARCH_FUZZY_THRESHOLD = 0.6
+WATCH_COALESCE_MS = 1500
+# Pendant un gros téléchargement les événements n'arrêtent pas : on rafraîchit quand même au bout de ce délai
+WATCH_MAX_DELAY_MS = 10000
+WATCH_POLL_INTERVAL_MS = 5000
+STEAM_LIBRARY_CACHE_PATH = r"C:\Program Files (x86)\Steam\appcache\librarycache"
+# Ancien et nouveau format de librarycache, dans l'ordre de préférence pour une carte paysage
+COVER_ART_NAMES = ("{appid}_header.jpg", "{appid}/header.jpg", "{appid}_library_hero.jpg")
+THUMBNAIL_DIR = os.path.join(os.path.expanduser("~"), ".steam_simple_thumbnails")
+THUMBNAIL_DISK_BYTES = 64 << 20
+THUMBNAIL_MEMORY_ITEMS = 256
+THUMBNAIL_THREADS = 2
+THUMBNAIL_PREFETCH_PAGES = 1
+THUMBNAIL_PREFETCH_DELAY_MS = 50
+WARMUP_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_warmup.json")
+WARMUP_VERSION = 1
+WARMUP_MAX_BYTES = 1 << 30
+WARMUP_MAX_FILES = 200
+# Débit plafonné pour laisser le disque (et l'interface) respirer pendant le préchargement
+WARMUP_RATE_BYTES = 200 << 20
+WARMUP_CHUNK_BYTES = 1 << 20
+WARMUP_LIBRARY_EXTENSIONS = (".dll", ".so", ".dylib")
+# Motifs relatifs au dossier du jeu, remplaçables par jeu avec la clé "assets" du fichier de préchargement
+WARMUP_ASSET_PATTERNS = ("*.pak", "*.vpk", "*_dir.vpk", "*.assets", "Content/Paks/*.pak")
+# Échantillons (en secondes après le lancement) des fichiers ouverts par le jeu
+WARMUP_LEARN_DELAYS = (5, 20, 60)
+WARMUP_LEARN_MAX_FILES = 100
+LAUNCH_HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_launches.jsonl")
+LAUNCH_HISTORY_MAX_BYTES = 1 << 20
+# Nombre de jeux en cours de démarrage en même temps ; les suivants attendent leur tour
+LAUNCH_MAX_CONCURRENT = 2
+VERIFY_DIR = os.path.join(os.path.expanduser("~"), ".steam_simple_verify")
+VERIFY_VERSION = 1
+# Fenêtre mmap lue à la fois par un processus de hachage : la mémoire reste bornée même pour un fichier de 50 Go
+VERIFY_WINDOW_BYTES = 64 << 20
+VERIFY_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+# Les petits fichiers partent par lots pour ne pas payer un aller-retour entre processus par fichier
+VERIFY_BATCH_BYTES = 32 << 20
+VERIFY_BATCH_FILES = 256
+VERIFY_QUEUE_PER_WORKER = 4
+# En dessous, démarrer des processus coûte plus cher que de hacher dans le thread appelant
+VERIFY_INLINE_BYTES = 1 << 30
+VERIFY_REPORT_FILES = 200
+# Estimation mémoire des pages gardées en cache ; au-delà, les pages inactives les plus anciennes sont libérées
+PAGE_CACHE_BUDGET_BYTES = 96 << 20
+PAGE_DEFAULT_COST_BYTES = 256 << 10
+PAGE_GAME_COST_BYTES = 2 << 10
+# Animations de survol recyclées : au-delà de ce nombre en cours, la valeur finale est appliquée directement
+ANIMATION_POOL_SIZE = 8
+HOVER_FADE_MS = 150
+FRAME_TIME_SAMPLES = 600
+TRACE_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_trace.json")
+TRACE_METRICS_FILE = os.path.join(os.path.expanduser("~"), ".steam_simple_metrics.jsonl")
+TRACE_MAX_EVENTS = 100000
+TRACE_METRICS_MAX_BYTES = 1 << 20
+TRACE_METRICS_INTERVAL_MS = 60000
 
-def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
-    return {}
+class _NullSpan:
+    def __enter__(self):
+        return self
 
-def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f)
+    def __exit__(self, *exc):
+        return False
 
-def scan_games(steam_apps_path):
-    games = []
+    def set(self, **args):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, self.category, **self.args)
+        return False
+
+    def set(self, **args):
+        self.args.update(args)
+
+class Tracer:
+    # Désactivé, chaque appel se limite à un test de booléen
+    def __init__(self, max_events=TRACE_MAX_EVENTS):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=max_events)
+        self.counters = {}
+        self.stats = {}
+        self.threads = {}
+        self.lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def now(self):
+        return time.perf_counter()
+
+    def span(self, name, category="app", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def complete(self, name, start, category="app", **args):
+        if not self.enabled:
+            return
+        end = time.perf_counter()
+        tid = self._thread_id()
+        with self.lock:
+            self.events.append({
+                "name": name, "cat": category, "ph": "X", "tid": tid,
+                "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6, "args": args
+            })
+            stat = self.stats.setdefault(name, [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += end - start
+            stat[2] = max(stat[2], end - start)
+
+    def instant(self, name, category="app", **args):
+        if not self.enabled:
+            return
+        tid = self._thread_id()
+        with self.lock:
+            self.events.append({
+                "name": name, "cat": category, "ph": "i", "s": "t", "tid": tid,
+                "ts": (time.perf_counter() - self.origin) * 1e6, "args": args
+            })
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            total = self.counters[name] = self.counters.get(name, 0) + value
+            self.events.append({
+                "name": name, "ph": "C", "tid": 0,
+                "ts": (time.perf_counter() - self.origin) * 1e6, "args": {name: total}
+            })
+
+    def _thread_id(self):
+        thread = threading.current_thread()
+        if thread.ident not in self.threads:
+            self.threads[thread.ident] = thread.name
+        return thread.ident
+
+    def export_chrome_trace(self, path=None):
+        pid = os.getpid()
+        with self.lock:
+            events = [dict(event, pid=pid) for event in self.events]
+            events.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                          for tid, name in self.threads.items())
+        # Appelé depuis un slot Qt : une exception non rattrapée y fermerait l'application
+        try:
+            write_json_atomic(path or TRACE_FILE, {"traceEvents": events, "displayTimeUnit": "ms"})
+        except OSError as e:
+            print("Error saving trace:", e)
+
+    def write_metrics(self, path=None):
+        path = path or TRACE_METRICS_FILE
+        with self.lock:
+            record = {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "uptime_s": round(time.perf_counter() - self.origin, 3),
+                "spans": {
+                    name: {"count": count, "total_ms": round(total * 1000, 3), "max_ms": round(worst * 1000, 3)}
+                    for name, (count, total, worst) in self.stats.items()
+                },
+                "counters": dict(self.counters)
+            }
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > TRACE_METRICS_MAX_BYTES:
+                os.replace(path, path + ".1")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print("Error saving trace metrics:", e)
+
+TRACER = Tracer()
+
+def _migrate_config_v1(config):
+    # Version 1 : objet plat {"steam_apps_path": ..., "prewarm": ...}, sans numéro de version
+    migrated = {"version": 2, "profiles": {}, "games": {}}
+    for key in ("steam_apps_path", "prewarm"):
+        if key in config:
+            migrated[key] = config[key]
+    return migrated
+
+CONFIG_MIGRATIONS = {1: _migrate_config_v1}
+
+def migrate_config(config):
+    if not isinstance(config, dict):
+        raise ValueError(f"config is a JSON {type(config).__name__}, not an object")
+    version = config.get("version", 1)
+    if type(version) is not int or (version < CONFIG_VERSION and version not in CONFIG_MIGRATIONS):
+        raise ValueError(f"unknown config version {version!r}")
+    while version < CONFIG_VERSION:
+        config = CONFIG_MIGRATIONS[version](config)
+        version = config["version"]
+    if not isinstance(config.get("profiles"), dict):
+        config["profiles"] = {}
+    if not isinstance(config.get("games"), dict):
+        config["games"] = {}
+    return config
+
+class ConfigStore:
+    # Une seule copie en mémoire ; les écritures sont atomiques et regroupées par un minuteur
+    def __init__(self, path=None, delay=CONFIG_SAVE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.lock = threading.RLock()
+        self.data = None
+        self.dirty = False
+        self.timer = None
+
+    def file_path(self):
+        return self.path or CONFIG_FILE
+
+    def load(self):
+        with self.lock:
+            if self.data is not None:
+                return self.data
+            path = self.file_path()
+            config = {"version": CONFIG_VERSION}
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+                self.data = migrate_config(config)
+                version = config.get("version", 1)
+            except FileNotFoundError:
+                version = CONFIG_VERSION
+                self.data = migrate_config(config)
+            except (OSError, ValueError) as e:
+                # Fichier illisible ou version inconnue : mis de côté, l'application repart des valeurs par défaut
+                print("Config unreadable, starting from defaults:", e)
+                try:
+                    os.replace(path, path + ".bad")
+                except OSError:
+                    pass
+                version = CONFIG_VERSION
+                self.data = migrate_config({"version": CONFIG_VERSION})
+            if version != self.data["version"]:
+                self.schedule_save()
+            return self.data
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self.load().get(key, default)
+
+    def set(self, key, value):
+        with self.lock:
+            config = self.load()
+            if config.get(key) != value:
+                config[key] = value
+                self.schedule_save()
+
+    def profile(self, account):
+        with self.lock:
+            config = self.load()
+            entry = config["profiles"].get(account.get("SteamID") or account.get("AccountName"), {})
+            return {
+                "steam_apps_path": entry.get("steam_apps_path") or config.get("steam_apps_path"),
+                "library_index": entry.get("library_index"),
+                "library_snapshot": entry.get("library_snapshot")
+            }
+
+    def set_profile(self, account, **values):
+        with self.lock:
+            config = self.load()
+            entry = config["profiles"].setdefault(account.get("SteamID") or account.get("AccountName"), {})
+            entry.update(values)
+            self.schedule_save()
+
+    def profile_cache_files(self, account):
+        # Index et snapshot propres au profil ; les fichiers communs d'avant servent de point de départ
+        settings = self.profile(account)
+        if settings["library_index"] and settings["library_snapshot"]:
+            return settings
+        import shutil
+        suffix = re.sub(r"[^\w.-]", "_", str(account.get("SteamID") or account.get("AccountName") or "default"))
+        files = {}
+        for key, default in (("library_index", LIBRARY_INDEX_FILE), ("library_snapshot", LIBRARY_SNAPSHOT_FILE)):
+            root, ext = os.path.splitext(default)
+            files[key] = settings[key] or f"{root}.{suffix}{ext}"
+            if not os.path.exists(files[key]) and os.path.exists(default):
+                try:
+                    shutil.copyfile(default, files[key])
+                except OSError as e:
+                    print("Error copying library cache:", e)
+        self.set_profile(account, **files)
+        return dict(settings, **files)
+
+    def game_preset(self, game):
+        with self.lock:
+            return dict(self.load()["games"].get(game_key(game), {}).get("preset") or {})
+
+    def set_game_preset(self, game, preset):
+        with self.lock:
+            games = self.load()["games"]
+            if games.get(game_key(game), {}).get("preset") != preset:
+                games.setdefault(game_key(game), {})["preset"] = preset
+                self.schedule_save()
+
+    def schedule_save(self):
+        with self.lock:
+            self.dirty = True
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty:
+                return
+            self.dirty = False
+            try:
+                write_json_atomic(self.file_path(), self.data)
+            except OSError as e:
+                print("Error saving config:", e)
+
+CONFIG = ConfigStore()
+atexit.register(CONFIG.flush)
+
+# Bits de StateFlags (EAppState) indiquant une mise à jour en attente ou en cours
+APP_STATE_UPDATE_FLAGS = 2 | 256 | 512 | 1024
+
+class VDFError(ValueError):
+    pass
+
+VDF_READ_CHUNK = 1 << 16
+VDF_OPEN = object()
+VDF_CLOSE = object()
+# Chaque caractère tombe dans une alternative : blanc/commentaire/condition, chaîne, accolade, mot nu,
+# ou guillemet seul (chaîne coupée en fin de bloc lu)
+_VDF_TOKEN_RE = re.compile(r'\s+|//[^\n]*|\[[^\]\n]*\]|"((?:[^"\\]|\\.)*)"|([{}])|([^\s{}"]+)|(")')
+_VDF_ESCAPES = {"n": "\n", "t": "\t"}
+
+def _vdf_unescape(text):
+    if "\\" not in text:
+        return text
+    return re.sub(r"\\(.)", lambda m: _VDF_ESCAPES.get(m.group(1), m.group(1)), text)
+
+def iter_vdf_tokens(stream):
+    # Lecture par blocs découpés au dernier saut de ligne : seul le reste est recopié au bloc suivant
+    find_tokens = _VDF_TOKEN_RE.finditer
+    carry, eof = "", False
+    while not eof:
+        chunk = stream.read(VDF_READ_CHUNK)
+        eof = not chunk
+        buffer = carry + chunk
+        cut = len(buffer) if eof else buffer.rfind("\n") + 1
+        carry = buffer[cut:]
+        for match in find_tokens(buffer, 0, cut):
+            group = match.lastindex
+            if group == 1:
+                yield _vdf_unescape(match.group(1))
+            elif group == 2:
+                yield VDF_OPEN if match.group(2) == "{" else VDF_CLOSE
+            elif group == 3:
+                yield match.group(3)
+            elif group == 4:
+                if eof:
+                    # Chaîne non fermée en fin de fichier
+                    yield _vdf_unescape(buffer[match.end():])
+                    return
+                carry = buffer[match.start():]
+                break
+
+def _skip_vdf_block(tokens):
+    depth = 1
+    for token in tokens:
+        if token is VDF_OPEN:
+            depth += 1
+        elif token is VDF_CLOSE:
+            depth -= 1
+            if depth == 0:
+                return
+
+def _seek_vdf_section(tokens, section):
+    wanted = [key.lower() for key in section]
+    depth = 0
+    key = None
+    for token in tokens:
+        if token is VDF_OPEN:
+            if key is not None and key.lower() == wanted[depth]:
+                depth += 1
+                if depth == len(wanted):
+                    return True
+            else:
+                _skip_vdf_block(tokens)
+            key = None
+        elif token is VDF_CLOSE:
+            if depth:
+                return False
+            key = None
+        elif key is None:
+            key = token
+        else:
+            key = None
+    return False
+
+def _build_vdf(tokens, nested=False):
+    root = {}
+    stack = [root]
+    key = None
+    for token in tokens:
+        if token is VDF_OPEN:
+            child = {}
+            if key is not None:
+                stack[-1][key] = child
+                key = None
+            stack.append(child)
+        elif token is VDF_CLOSE:
+            if len(stack) > 1:
+                stack.pop()
+            elif nested:
+                break
+            key = None
+        elif key is None:
+            key = token
+        else:
+            stack[-1][key] = token
+            key = None
+    return root
+
+def load_vdf(filepath, section=()):
+    with TRACER.span("vdf.parse", "vdf", path=filepath, section="/".join(section)), \
+            open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        tokens = iter_vdf_tokens(f)
+        if not section:
+            return _build_vdf(tokens)
+        # Seule la sous-arborescence demandée est construite, le reste est juste sauté
+        if not _seek_vdf_section(tokens, section):
+            return None
+        return _build_vdf(tokens, nested=True)
+
+def load_vdf_sections(filepath, sections):
+    # Plusieurs sous-arborescences en une seule lecture : utile pour les gros fichiers comme localconfig.vdf
+    wanted = {tuple(key.lower() for key in section): section for section in sections}
+    prefixes = {path[:i] for path in wanted for i in range(1, len(path))}
+    found = {}
+    with TRACER.span("vdf.parse", "vdf", path=filepath, sections=len(sections)), \
+            open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        tokens = iter_vdf_tokens(f)
+        path = ()
+        key = None
+        for token in tokens:
+            if token is VDF_OPEN:
+                current = path + (key.lower(),) if key is not None else None
+                if current in wanted:
+                    found[wanted[current]] = _build_vdf(tokens, nested=True)
+                elif current in prefixes:
+                    path = current
+                else:
+                    _skip_vdf_block(tokens)
+                key = None
+            elif token is VDF_CLOSE:
+                path = path[:-1]
+                key = None
+            elif key is None:
+                key = token
+            else:
+                key = None
+    return found
+
+def parse_vdf_text(text, section=()):
+    tokens = iter_vdf_tokens(io.StringIO(text))
+    if not section:
+        return _build_vdf(tokens)
+    if not _seek_vdf_section(tokens, section):
+        return None
+    return _build_vdf(tokens, nested=True)
+
+def parse_acf(filepath):
+    try:
+        return load_vdf(filepath)
+    except OSError as e:
+        print("Error reading manifest:", e)
+        return {}
+
+BVDF_MAP, BVDF_STRING, BVDF_INT32, BVDF_FLOAT32, BVDF_POINTER = 0, 1, 2, 3, 4
+BVDF_WSTRING, BVDF_COLOR, BVDF_UINT64, BVDF_END, BVDF_INT64, BVDF_END_ALT = 5, 6, 7, 8, 10, 11
+_INT32 = struct.Struct("<i")
+_UINT32 = struct.Struct("<I")
+_FLOAT32 = struct.Struct("<f")
+_UINT64 = struct.Struct("<Q")
+_INT64 = struct.Struct("<q")
+_BVDF_NUMBERS = {
+    BVDF_INT32: _INT32, BVDF_POINTER: _INT32, BVDF_COLOR: _UINT32,
+    BVDF_FLOAT32: _FLOAT32, BVDF_UINT64: _UINT64, BVDF_INT64: _INT64
+}
+
+def _read_cstring(buf, offset):
+    stop = buf.find(b"\0", offset)
+    if stop < 0:
+        raise VDFError(f"Unterminated string at offset {offset}")
+    return bytes(buf[offset:stop]).decode("utf-8", "replace"), stop + 1
+
+def _read_wstring(buf, offset):
+    stop = offset
+    while True:
+        stop = buf.find(b"\0\0", stop)
+        if stop < 0:
+            raise VDFError(f"Unterminated wide string at offset {offset}")
+        if (stop - offset) % 2 == 0:
+            return bytes(buf[offset:stop]).decode("utf-16-le", "replace"), stop + 2
+        stop += 1
+
+def parse_binary_vdf(buf, offset=0, string_table=None):
+    # buf peut être un mmap : les nombres sont lus sur place avec unpack_from
+    root = {}
+    stack = [root]
+    end = len(buf)
+    while offset < end:
+        kind = buf[offset]
+        offset += 1
+        if kind in (BVDF_END, BVDF_END_ALT):
+            if len(stack) == 1:
+                return root, offset
+            stack.pop()
+            continue
+        if string_table is None:
+            key, offset = _read_cstring(buf, offset)
+        else:
+            (key_index,) = _INT32.unpack_from(buf, offset)
+            offset += 4
+            try:
+                key = string_table[key_index]
+            except IndexError:
+                raise VDFError(f"Bad string table index {key_index} at offset {offset - 4}")
+        if kind == BVDF_MAP:
+            child = {}
+            stack[-1][key] = child
+            stack.append(child)
+        elif kind == BVDF_STRING:
+            stack[-1][key], offset = _read_cstring(buf, offset)
+        elif kind == BVDF_WSTRING:
+            stack[-1][key], offset = _read_wstring(buf, offset)
+        elif kind in _BVDF_NUMBERS:
+            number = _BVDF_NUMBERS[kind]
+            if offset + number.size > end:
+                break
+            (stack[-1][key],) = number.unpack_from(buf, offset)
+            offset += number.size
+        else:
+            raise VDFError(f"Unknown binary VDF type {kind} at offset {offset}")
+    raise VDFError("Truncated binary VDF")
+
+def load_binary_vdf(filepath):
+    with TRACER.span("vdf.parse_binary", "vdf", path=filepath), open(filepath, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return parse_binary_vdf(data)[0]
+
+APPINFO_VERSIONS = {0x07564427: 27, 0x07564428: 28, 0x07564429: 29}
+
+class AppInfoReader:
+    def __init__(self, filepath):
+        self._file = open(filepath, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index()
+        except (ValueError, struct.error, VDFError) as e:
+            self.close()
+            raise VDFError(f"Invalid appinfo.vdf: {e}")
+
+    def _index(self):
+        data = self._map
+        magic, self.universe = struct.unpack_from("<II", data, 0)
+        self.version = APPINFO_VERSIONS.get(magic)
+        if self.version is None:
+            raise VDFError(f"unknown magic {magic:#x}")
+        offset = 8
+        end = len(data)
+        self.string_table = None
+        if self.version >= 29:
+            (table_offset,) = _INT64.unpack_from(data, offset)
+            offset += 8
+            end = table_offset
+            self.string_table = self._read_string_table(table_offset)
+        # appid, taille, puis infoState, lastUpdated, picsToken, sha1, changeNumber (+ sha1 binaire)
+        header_size = 40 + (20 if self.version >= 28 else 0)
+        self._offsets = {}
+        while offset + 4 <= end:
+            (appid,) = _UINT32.unpack_from(data, offset)
+            if appid == 0:
+                break
+            (size,) = _UINT32.unpack_from(data, offset + 4)
+            start = offset + 8
+            self._offsets[appid] = (start, start + header_size)
+            offset = start + size
+
+    def _read_string_table(self, offset):
+        (count,) = _UINT32.unpack_from(self._map, offset)
+        offset += 4
+        table = []
+        for _ in range(count):
+            string, offset = _read_cstring(self._map, offset)
+            table.append(string)
+        return table
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __contains__(self, appid):
+        return int(appid) in self._offsets
+
+    def header(self, appid):
+        start = self._offsets[int(appid)][0]
+        info_state, last_updated, pics_token = struct.unpack_from("<IIQ", self._map, start)
+        (change_number,) = _UINT32.unpack_from(self._map, start + 36)
+        return {
+            "info_state": info_state, "last_updated": last_updated,
+            "pics_token": pics_token, "change_number": change_number
+        }
+
+    def get(self, appid, default=None):
+        entry = self._offsets.get(int(appid))
+        if entry is None:
+            return default
+        with TRACER.span("vdf.appinfo_get", "vdf", appid=int(appid)):
+            tree = parse_binary_vdf(self._map, entry[1], self.string_table)[0]
+        return tree.get("appinfo", tree)
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+MANIFEST_FIELDS = ("appid", "name", "installdir", "SizeOnDisk", "StateFlags", "buildid")
+
+def read_app_manifests(steamapps_dir, cache=None):
+    manifests = {}
+    previous = dict(cache["files"]) if cache and "files" in cache else {}
+    try:
+        entries = list(os.scandir(steamapps_dir))
+    except OSError:
+        return manifests
+    files = {}
+    # Un manifest réécrit sur place ne change pas la date du dossier steamapps : chaque fichier est comparé
+    for entry in entries:
+        name = entry.name.lower()
+        if not (name.startswith("appmanifest_") and name.endswith(".acf")):
+            continue
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        cached = previous.get(entry.name)
+        if isinstance(cached, dict) and cached.get("mtime") == mtime:
+            state = cached.get("state")
+        else:
+            TRACER.count("manifests_parsed")
+            state = parse_acf(entry.path).get("AppState")
+            if isinstance(state, dict):
+                state = {k: state[k] for k in MANIFEST_FIELDS if isinstance(state.get(k), str)}
+            else:
+                state = None
+        files[entry.name] = {"mtime": mtime, "state": state}
+    if cache is not None:
+        cache.pop("mtime", None)
+        cache["files"] = files
+    for info in files.values():
+        state = info.get("state")
+        if state and state.get("installdir"):
+            manifests[state["installdir"].lower()] = state
+    return manifests
+
+def _to_int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+def game_from_manifest(manifest, full_path):
+    state_flags = _to_int(manifest.get("StateFlags"))
+    return {
+        "name": manifest.get("name") or os.path.basename(full_path),
+        "exe": None,
+        "update": bool(state_flags & APP_STATE_UPDATE_FLAGS),
+        "appid": manifest.get("appid"),
+        "installdir": manifest.get("installdir"),
+        "path": full_path,
+        "size": _to_int(manifest.get("SizeOnDisk")),
+        "buildid": manifest.get("buildid"),
+        "state_flags": state_flags
+    }
+
+def find_game_exe(full_path, cancel=None):
+    walked = 0
+    try:
+        for root, dirs, files in os.walk(full_path):
+            if cancel and cancel.is_set():
+                return None
+            walked += len(files)
+            for file in files:
+                if file.lower().endswith(".exe"):
+                    return os.path.join(root, file)
+        return None
+    finally:
+        TRACER.count("files_walked", walked)
+
+def resolve_game_exe(game):
+    # Les jeux issus d'un manifest ne connaissent pas leur exe avant le premier lancement,
+    # et un exe mis en cache peut avoir disparu depuis
+    exe = game.get("exe")
+    if (not exe or not os.path.exists(exe)) and game.get("path"):
+        game["exe"] = find_game_exe(game["path"])
+    return game.get("exe")
+
+def scan_game_folder(full_path):
+    exe_path = find_game_exe(full_path)
+    if not exe_path:
+        return None
+    update_available = os.path.exists(os.path.join(full_path, "update.flag"))
+    return {
+        "name": os.path.basename(full_path),
+        "exe": exe_path,
+        "update": update_available,
+        "path": full_path
+    }
+
+def load_library_index(path=None):
+    try:
+        with open(path or LIBRARY_INDEX_FILE, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if isinstance(index, dict) and index.get("version") == LIBRARY_INDEX_VERSION \
+                and isinstance(index.get("libraries"), dict):
+            return index
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print("Library index unreadable, doing a full scan:", e)
+    return {"version": LIBRARY_INDEX_VERSION, "libraries": {}}
+
+def write_json_atomic(path, data):
+    # Un nom par thread : le scan et l'interface peuvent écrire le même index sans partager le fichier temporaire
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def save_library_index(index, path=None):
+    try:
+        write_json_atomic(path or LIBRARY_INDEX_FILE, index)
+    except OSError as e:
+        print("Error saving library index:", e)
+
+def load_library_snapshot(steam_apps_path, path=None):
+    try:
+        with open(path or LIBRARY_SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if isinstance(snapshot, dict) and snapshot.get("version") == LIBRARY_SNAPSHOT_VERSION:
+            games = snapshot.get("libraries", {}).get(os.path.normcase(os.path.abspath(steam_apps_path)))
+            if isinstance(games, list):
+                return games
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print("Library snapshot unreadable:", e)
+    return None
+
+def save_library_snapshot(steam_apps_path, games, path=None):
+    path = path or LIBRARY_SNAPSHOT_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if not isinstance(snapshot, dict) or snapshot.get("version") != LIBRARY_SNAPSHOT_VERSION:
+            raise ValueError("outdated snapshot")
+    except (OSError, ValueError):
+        snapshot = {"version": LIBRARY_SNAPSHOT_VERSION, "libraries": {}}
+    snapshot.setdefault("libraries", {})[os.path.normcase(os.path.abspath(steam_apps_path))] = games
+    try:
+        write_json_atomic(path, snapshot)
+    except OSError as e:
+        print("Error saving library snapshot:", e)
+
+def iter_games(steam_apps_path, use_manifests=True, index=None, cancel=None):
     if not os.path.isdir(steam_apps_path):
-        return games
-    for game_folder in os.listdir(steam_apps_path):
-        full_path = os.path.join(steam_apps_path, game_folder)
-        if os.path.isdir(full_path):
-            exe_path = None
-            for root, dirs, files in os.walk(full_path):
-                for file in files:
-                    if file.lower().endswith(".exe"):
-                        exe_path = os.path.join(root, file)
+        return
+    library = None
+    if index is not None:
+        key = os.path.normcase(os.path.abspath(steam_apps_path))
+        library = index["libraries"].setdefault(key, {})
+    manifests = {}
+    if use_manifests:
+        manifest_cache = library.setdefault("manifests", {}) if library is not None else None
+        manifests = read_app_manifests(os.path.dirname(os.path.normpath(steam_apps_path)), manifest_cache)
+    previous = library.get("folders", {}) if library is not None else {}
+    folders = {}
+    stated = walked = found = 0
+    try:
+        with TRACER.span("scan.library", "scan", path=steam_apps_path), os.scandir(steam_apps_path) as entries:
+            for entry in entries:
+                if cancel is not None and cancel.is_set():
+                    # Scan interrompu : l'index garde ses anciennes entrées pour cette bibliothèque
+                    return
+                if not entry.is_dir():
+                    continue
+                try:
+                    stated += 1
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                cached = previous.get(entry.name)
+                if not isinstance(cached, dict) or cached.get("mtime") != mtime:
+                    cached = None
+                manifest = manifests.get(entry.name.lower())
+                if manifest:
+                    game = game_from_manifest(manifest, entry.path)
+                    if cached and cached.get("game"):
+                        game["exe"] = cached["game"].get("exe")
+                elif cached and (cached.get("game") is None or "appid" not in cached["game"]):
+                    game = cached["game"]
+                else:
+                    walked += 1
+                    game = scan_game_folder(entry.path)
+                folders[entry.name] = {"mtime": mtime, "game": game}
+                if game:
+                    found += 1
+                    yield game
+    finally:
+        TRACER.count("folders_stated", stated)
+        TRACER.count("folders_walked", walked)
+        TRACER.count("games_scanned", found)
+    if library is not None:
+        library["folders"] = folders
+
+def scan_games(steam_apps_path, use_manifests=True, index=None):
+    return list(iter_games(steam_apps_path, use_manifests, index))
+
+def find_library_folders(steam_apps_path):
+    candidates = [steam_apps_path]
+    vdf_paths = [
+        os.path.join(os.path.dirname(os.path.normpath(steam_apps_path)), "libraryfolders.vdf"),
+        STEAM_LIBRARY_FOLDERS_PATH
+    ]
+    for vdf_path in vdf_paths:
+        if not os.path.isfile(vdf_path):
+            continue
+        folders = parse_acf(vdf_path)
+        folders = folders.get("libraryfolders") or folders.get("LibraryFolders") or {}
+        for key, value in folders.items():
+            # Ancien format : "1" "D:\\SteamLibrary", nouveau : "1" { "path" "..." }
+            path = value.get("path") if isinstance(value, dict) else value
+            if key.isdigit() and path:
+                candidates.append(os.path.join(path, "steamapps", "common"))
+    libraries = []
+    seen = set()
+    for path in candidates:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen and os.path.isdir(path):
+            seen.add(key)
+            libraries.append(path)
+    return libraries
+
+def _device_of(path):
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return path
+
+def game_key(game):
+    return game.get("appid") or os.path.normcase(os.path.realpath(game["path"]))
+
+def iter_libraries(steam_apps_path, index=None, cancel=None, max_workers=SCAN_MAX_WORKERS):
+    libraries = find_library_folders(steam_apps_path)
+    if not libraries:
+        return
+    device_locks = {}
+    for path in libraries:
+        device_locks.setdefault(_device_of(path), threading.BoundedSemaphore(SCAN_THREADS_PER_DEVICE))
+    results = queue.Queue()
+    done = object()
+
+    def scan_one(position, path):
+        try:
+            with device_locks[_device_of(path)]:
+                for game in iter_games(path, index=index, cancel=cancel):
+                    results.put((position, game))
+        except Exception as e:
+            print("Error scanning library:", path, e)
+        finally:
+            results.put((position, done))
+
+    from concurrent.futures import ThreadPoolExecutor
+    seen = set()
+    # Les jeux sont rendus dans l'ordre des bibliothèques : pour un appid présent deux fois,
+    # c'est toujours la copie de la première bibliothèque (celle configurée) qui est gardée
+    buffered = [[] for _ in libraries]
+    finished = [False] * len(libraries)
+    current = 0
+
+    def accept(game):
+        key = game_key(game)
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(libraries)))) as pool:
+        for position, path in enumerate(libraries):
+            pool.submit(scan_one, position, path)
+        while current < len(libraries):
+            position, game = results.get()
+            if game is not done:
+                if position != current:
+                    buffered[position].append(game)
+                elif accept(game):
+                    yield game
+                continue
+            finished[position] = True
+            while current < len(libraries) and finished[current]:
+                current += 1
+                if current < len(libraries):
+                    games, buffered[current] = buffered[current], []
+                    for game in games:
+                        if accept(game):
+                            yield game
+
+def scan_libraries(steam_apps_path, index=None, max_workers=SCAN_MAX_WORKERS):
+    return list(iter_libraries(steam_apps_path, index=index, max_workers=max_workers))
+
+def library_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+def refresh_library(library_path, index, known):
+    current = {game_key(game): game for game in iter_games(library_path, index=index)}
+    added = [game for key, game in current.items() if key not in known]
+    removed = [key for key in known if key not in current]
+    updated = [game for key, game in current.items() if key in known and known[key] != game]
+    return current, added, removed, updated
+
+def set_indexed_exe(index, game):
+    # Les jeux passent par copie dans les signaux Qt : l'exe trouvé est reporté dans l'index par clé
+    path = os.path.normpath(game["path"])
+    library = index["libraries"].get(library_key(os.path.dirname(path))) or {}
+    folder = library.get("folders", {}).get(os.path.basename(path))
+    if not isinstance(folder, dict) or not folder.get("game"):
+        return False
+    folder["game"]["exe"] = game.get("exe")
+    return True
+
+def library_cache_dirs(steam_apps_path):
+    # steam_apps_path pointe sur steamapps/common : l'installation Steam est deux niveaux au-dessus
+    steam_root = os.path.dirname(os.path.dirname(os.path.abspath(steam_apps_path)))
+    dirs = [os.path.join(steam_root, "appcache", "librarycache"), STEAM_LIBRARY_CACHE_PATH]
+    return [path for i, path in enumerate(dirs) if path not in dirs[:i]]
+
+def find_cover_art(appid, cache_dirs):
+    for folder in cache_dirs:
+        for pattern in COVER_ART_NAMES:
+            path = os.path.join(folder, pattern.format(appid=appid))
+            try:
+                return path, os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+    return None, None
+
+def load_warmup_store():
+    try:
+        with open(WARMUP_FILE, "r", encoding="utf-8") as f:
+            store = json.load(f)
+        if isinstance(store, dict) and store.get("version") == WARMUP_VERSION \
+                and isinstance(store.get("games"), dict):
+            return store
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print("Warm-up lists unreadable:", e)
+    return {"version": WARMUP_VERSION, "games": {}}
+
+def save_warmup_store(store):
+    try:
+        write_json_atomic(WARMUP_FILE, store)
+    except OSError as e:
+        print("Error saving warm-up lists:", e)
+
+def warmup_plan(game, entry=None, max_bytes=WARMUP_MAX_BYTES, max_files=WARMUP_MAX_FILES, cancel=None):
+    import glob
+    entry = entry or {}
+    root = game.get("path") or ""
+    exe = game.get("exe")
+    if (not exe or not os.path.exists(exe)) and root:
+        exe = find_game_exe(root, cancel)
+        if cancel and cancel.is_set():
+            return []
+        if exe:
+            # Le dossier vient d'être parcouru : le lancement reprendra cet exe sans le refaire
+            game["exe"] = exe
+    # Ordre de priorité : exe, bibliothèques à côté, fichiers appris aux lancements précédents, assets lourds
+    candidates = []
+    if exe:
+        candidates.append(exe)
+        try:
+            with os.scandir(os.path.dirname(exe)) as entries:
+                candidates.extend(sorted(e.path for e in entries
+                                         if e.name.lower().endswith(WARMUP_LIBRARY_EXTENSIONS) and e.is_file()))
+        except OSError:
+            pass
+    learned = entry.get("files") or {}
+    candidates.extend(os.path.join(root, rel) for rel in sorted(learned, key=lambda rel: -learned[rel]))
+    if root:
+        for pattern in entry.get("assets") or WARMUP_ASSET_PATTERNS:
+            candidates.extend(sorted(glob.glob(os.path.join(glob.escape(root), pattern))))
+    plan = []
+    seen = set()
+    total = 0
+    for path in candidates:
+        key = os.path.normcase(path)
+        if key in seen:
+            continue
+        seen.add(key)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        if total + size > max_bytes:
+            continue
+        plan.append((path, size))
+        total += size
+        if len(plan) >= max_files:
+            break
+    return plan
+
+def warm_file(path, buffer, cancel=None, throttle=None):
+    # Lecture séquentielle sans rien garder : seul le cache de pages du système en profite
+    read = 0
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while not (cancel and cancel.is_set()):
+            n = f.readinto(buffer)
+            if not n:
+                break
+            read += n
+            if throttle:
+                throttle(n)
+    return read
+
+def warm_files(plan, cancel=None, rate=WARMUP_RATE_BYTES, progress=None):
+    buffer = bytearray(WARMUP_CHUNK_BYTES)
+    start = time.perf_counter()
+    stats = {"files": 0, "bytes": 0, "planned_bytes": sum(size for _, size in plan), "seconds": 0.0, "completed": False}
+
+    def throttle(n):
+        stats["bytes"] += n
+        ahead = stats["bytes"] / rate - (time.perf_counter() - start)
+        if ahead > 0:
+            if cancel:
+                cancel.wait(ahead)
+            else:
+                time.sleep(ahead)
+
+    for path, _ in plan:
+        if cancel and cancel.is_set():
+            break
+        try:
+            warm_file(path, buffer, cancel, throttle)
+        except OSError as e:
+            print("Error warming up file:", e)
+            continue
+        stats["files"] += 1
+        if progress:
+            progress(stats["bytes"], stats["files"])
+    else:
+        stats["completed"] = True
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+def find_game_pids(exe, backend=None):
+    name = os.path.basename(exe).lower()
+    try:
+        processes = (backend or default_process_backend()).processes()
+    except Exception as e:
+        print("Error listing processes:", e)
+        return []
+    # /proc/<pid>/comm tronque les noms à 15 caractères
+    return [pid for pid, comm in processes.items()
+            if comm.lower() == name or (len(comm) == 15 and name.startswith(comm.lower()))]
+
+def process_open_files(pid):
+    # Fichiers mappés (exe, bibliothèques) et ouverts par le processus ; None sans /proc
+    paths = set()
+    try:
+        with open(f"/proc/{pid}/maps", "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                parts = line.split(None, 5)
+                if len(parts) == 6 and parts[5].startswith("/"):
+                    paths.add(parts[5].rstrip("\n"))
+    except OSError:
+        return None
+    try:
+        for fd in os.listdir(f"/proc/{pid}/fd"):
+            try:
+                target = os.readlink(f"/proc/{pid}/fd/{fd}")
+            except OSError:
+                continue
+            if target.startswith("/"):
+                paths.add(target)
+    except OSError:
+        pass
+    return paths
+
+def files_accessed_since(root, since, limit=WARMUP_LEARN_MAX_FILES):
+    # Repli sans /proc : dates de dernier accès, quand le système de fichiers les tient à jour
+    found = set()
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                if os.stat(path).st_atime >= since:
+                    found.add(path)
+            except OSError:
+                continue
+            if len(found) >= limit:
+                return found
+    return found
+
+def record_launch_files(entry, root, paths, limit=WARMUP_LEARN_MAX_FILES):
+    root = os.path.normcase(os.path.realpath(root))
+    files = entry.setdefault("files", {})
+    for path in paths:
+        real = os.path.normcase(os.path.realpath(path))
+        if real.startswith(root + os.sep) and os.path.isfile(real):
+            rel = os.path.relpath(real, root)
+            files[rel] = files.get(rel, 0) + 1
+    if len(files) > limit:
+        entry["files"] = dict(sorted(files.items(), key=lambda item: -item[1])[:limit])
+    entry["launches"] = entry.get("launches", 0) + 1
+    return entry
+
+def learn_launch_files(game, pid=None, started=None, stop=None, delays=WARMUP_LEARN_DELAYS):
+    root, exe = game.get("path"), game.get("exe")
+    if not root or not exe:
+        return
+    started = started or time.time()
+    stop = stop or threading.Event()
+    seen = set()
+    if os.path.isdir("/proc"):
+        elapsed = 0
+        for delay in delays:
+            if stop.wait(max(0, delay - elapsed)):
+                return
+            elapsed = delay
+            # Lancé via startfile ou un lanceur : le jeu est retrouvé par le nom de son exe
+            pids = set(find_game_pids(exe))
+            if pid:
+                pids.add(pid)
+            for game_pid in pids:
+                seen.update(process_open_files(game_pid) or ())
+    else:
+        if stop.wait(delays[-1]):
+            return
+        seen = files_accessed_since(root, started)
+    if not seen:
+        return
+    store = load_warmup_store()
+    record_launch_files(store["games"].setdefault(game_key(game), {}), root, seen)
+    save_warmup_store(store)
+    TRACER.instant("warmup.learned", "launch", game=game.get("name"), files=len(seen))
+
+def build_launch_argv(exe, params="", options=()):
+    import shlex
+    # Sous Windows shlex garde les guillemets autour des arguments : subprocess les remettra si besoin
+    args = shlex.split(params or "", posix=os.name != "nt")
+    if os.name == "nt":
+        args = [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg for arg in args]
+    return [exe] + args + [option for option in options if option not in args]
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds or 0), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours} h {minutes:02d} min"
+    return f"{minutes} min {seconds:02d} s" if minutes else f"{seconds} s"
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+def append_launch_record(record, path=None):
+    path = path or LAUNCH_HISTORY_FILE
+    try:
+        if os.path.exists(path) and os.path.getsize(path) > LAUNCH_HISTORY_MAX_BYTES:
+            os.replace(path, path + ".1")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        print("Error saving launch history:", e)
+
+def run_launch(game, argv, on_started=None, wait=True):
+    import subprocess
+    record = {"game": game.get("name"), "appid": game.get("appid"), "argv": argv,
+              "started": time.strftime("%Y-%m-%dT%H:%M:%S"), "spawn_ms": None, "session_s": None,
+              "exit_code": None, "error": None}
+    start = TRACER.now()
+    spawn_start = time.perf_counter()
+    try:
+        process = subprocess.Popen(argv, cwd=os.path.dirname(argv[0]) or None)
+    except OSError as e:
+        record["error"] = str(e)
+        TRACER.instant("game.spawn_failed", "launch", game=record["game"], error=str(e))
+        append_launch_record(record)
+        return record
+    record["spawn_ms"] = round((time.perf_counter() - spawn_start) * 1000, 3)
+    record["pid"] = process.pid
+    TRACER.complete("game.spawn", start, "launch", game=record["game"], pid=process.pid)
+    if on_started:
+        on_started(process.pid, record["spawn_ms"])
+    if wait:
+        record["exit_code"] = process.wait()
+        record["session_s"] = round(time.perf_counter() - spawn_start, 3)
+        TRACER.instant("game.exit", "launch", game=record["game"], exit_code=record["exit_code"],
+                       session_s=record["session_s"])
+        TRACER.count("launch.sessions")
+    append_launch_record(record)
+    return record
+
+def walk_install(root):
+    # Une seule entrée scandir donne type, taille et date : pas de stat supplémentaire par fichier sous Windows
+    folders = [""]
+    while folders:
+        folder = folders.pop()
+        try:
+            with os.scandir(os.path.join(root, folder)) as entries:
+                for entry in entries:
+                    relative = f"{folder}/{entry.name}" if folder else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            folders.append(relative)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            yield relative, stat.st_size, stat.st_mtime_ns
+                    except OSError:
+                        continue
+        except OSError as e:
+            print("Error reading install folder:", e)
+
+def hash_file(path, window=VERIFY_WINDOW_BYTES):
+    digest = hashlib.blake2b(digest_size=20)
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            offset = 0
+            while offset < size:
+                length = min(window, size - offset)
+                with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as data:
+                    digest.update(data)
+                offset += length
+    except (OSError, ValueError) as e:
+        return None, str(e)
+    return digest.hexdigest(), None
+
+def hash_files(root, batch):
+    # Exécuté dans un processus du pool : seuls les condensés repartent
+    return [(relative, *hash_file(os.path.join(root, relative))) for relative in batch]
+
+def verify_batches(pending, sizes):
+    batch, batch_bytes = [], 0
+    for relative in pending:
+        batch.append(relative)
+        batch_bytes += sizes[relative]
+        if batch_bytes >= VERIFY_BATCH_BYTES or len(batch) >= VERIFY_BATCH_FILES:
+            yield batch, batch_bytes
+            batch, batch_bytes = [], 0
+    if batch:
+        yield batch, batch_bytes
+
+def iter_file_hashes(root, pending, sizes, cancel=None, workers=VERIFY_WORKERS):
+    batches = verify_batches(pending, sizes)
+    if workers <= 1 or sum(sizes[relative] for relative in pending) < VERIFY_INLINE_BYTES:
+        for batch, batch_bytes in batches:
+            if cancel and cancel.is_set():
+                return
+            yield from hash_files(root, batch)
+        return
+    import multiprocessing, pickle
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    from concurrent.futures.process import BrokenProcessPool
+    queued = {}
+    try:
+        # spawn partout : un fork du processus Qt et de ses threads n'est pas sûr
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            while True:
+                while len(queued) < workers * VERIFY_QUEUE_PER_WORKER and not (cancel and cancel.is_set()):
+                    batch = next(batches, None)
+                    if batch is None:
                         break
-                if exe_path:
-                    break
-            if exe_path:
-                update_available = os.path.exists(os.path.join(full_path, "update.flag"))
-                games.append({
-                    "name": game_folder,
-                    "exe": exe_path,
-                    "update": update_available
-                })
-    return games
-
-def is_steam_running():
+                    queued[pool.submit(hash_files, root, batch[0])] = batch[0]
+                if not queued:
+                    return
+                finished, _ = wait(queued, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    results = future.result()
+                    del queued[future]
+                    yield from results
+    except (BrokenProcessPool, pickle.PicklingError) as e:
+        # Processus impossibles à lancer (antivirus...) ou script chargé hors d'un module importable
+        # (importlib) : le reste est haché ici
+        print("Hashing processes unavailable, verifying in this thread:", e)
+        for batch in list(queued.values()) + [batch for batch, batch_bytes in batches]:
+            if cancel and cancel.is_set():
+                return
+            yield from hash_files(root, batch)
+
+def verify_install(game, entry=None, cancel=None, progress=None, workers=VERIFY_WORKERS):
+    root = game["path"]
+    started = time.perf_counter()
+    if entry and entry.get("root") != os.path.normcase(os.path.abspath(root)):
+        entry = None
+    # Une mise à jour Steam change légitimement les fichiers : la référence repart du nouveau build
+    rebase = entry is None or entry.get("buildid") != game.get("buildid")
+    previous = entry["files"] if entry else {}
+    previous_missing = {} if rebase else entry.get("missing", {})
+    files, sizes, pending, folders = {}, {}, [], {}
+    total = done = 0
+    for relative, size, mtime in walk_install(root):
+        if cancel and cancel.is_set():
+            break
+        total += size
+        folder = relative.split("/", 1)[0] if "/" in relative else "."
+        folders[folder] = folders.get(folder, 0) + size
+        cached = previous.get(relative)
+        # Clé (chemin, taille, date) inchangée : le condensé en cache est repris sans relire le fichier
+        if cached and cached[0] == size and cached[1] == mtime:
+            files[relative] = cached[:3] if rebase else cached
+            done += size
+        else:
+            sizes[relative] = size
+            files[relative] = [size, mtime]
+            pending.append(relative)
+    if progress:
+        progress(done, total)
+    errors, hashed_bytes = [], 0
+    for relative, digest, error in iter_file_hashes(root, pending, sizes, cancel, workers):
+        size, mtime = files[relative]
+        done += size
+        hashed_bytes += size
+        cached = previous.get(relative)
+        reference = None
+        if not rebase:
+            if cached:
+                reference = cached[3] if len(cached) > 3 else cached[2]
+            else:
+                reference = previous_missing.get(relative)
+        if digest is None:
+            errors.append(f"{relative}: {error}")
+            if cached:
+                files[relative] = cached
+            else:
+                del files[relative]
+            continue
+        files[relative] = [size, mtime, digest] if reference in (None, digest) else [size, mtime, digest, reference]
+        if progress:
+            progress(done, total)
+    completed = not (cancel and cancel.is_set())
+    if completed:
+        missing = {relative: cached[3] if len(cached) > 3 else cached[2]
+                   for relative, cached in previous.items() if relative not in files and not rebase}
+        missing.update((relative, reference) for relative, reference in previous_missing.items()
+                       if relative not in files)
+    else:
+        # Vérification interrompue : ce qui a été haché est gardé, le reste reprend l'état précédent
+        files = dict(previous, **{relative: cached for relative, cached in files.items() if len(cached) > 2})
+        missing = previous_missing
+    modified = sorted(relative for relative, cached in files.items() if len(cached) > 3)
+    entry = {"version": VERIFY_VERSION, "root": os.path.normcase(os.path.abspath(root)),
+             "buildid": game.get("buildid"), "files": files, "missing": missing}
+    report = {
+        "files": len(files),
+        "bytes": total,
+        "hashed_files": len(pending),
+        "hashed_bytes": hashed_bytes,
+        "modified_count": len(modified),
+        "missing_count": len(missing),
+        "modified": modified[:VERIFY_REPORT_FILES],
+        "missing": sorted(missing)[:VERIFY_REPORT_FILES],
+        "errors": errors[:VERIFY_REPORT_FILES],
+        "folders": sorted(folders.items(), key=lambda item: -item[1])[:VERIFY_REPORT_FILES],
+        "seconds": round(time.perf_counter() - started, 3),
+        "verified": time.strftime("%Y-%m-%d %H:%M"),
+        "completed": completed
+    }
+    return report, entry
+
+def verify_entry_path(game, directory=None):
+    name = hashlib.blake2b(str(game_key(game)).encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(directory or VERIFY_DIR, name + ".json")
+
+def load_verify_entry(game, directory=None):
+    try:
+        with open(verify_entry_path(game, directory), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if isinstance(entry, dict) and entry.get("version") == VERIFY_VERSION and isinstance(entry.get("files"), dict):
+            return entry
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print("Verification cache unreadable, rehashing:", e)
+    return None
+
+def load_verify_reports(directory=None):
+    try:
+        with open(os.path.join(directory or VERIFY_DIR, "reports.json"), "r", encoding="utf-8") as f:
+            reports = json.load(f)
+        if isinstance(reports, dict) and reports.get("version") == VERIFY_VERSION:
+            return reports["games"]
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        print("Verification reports unreadable:", e)
+    return {}
+
+def save_verify_result(game, report, entry, directory=None):
+    directory = directory or VERIFY_DIR
+    try:
+        os.makedirs(directory, exist_ok=True)
+        write_json_atomic(verify_entry_path(game, directory), entry)
+        reports = load_verify_reports(directory)
+        reports[game_key(game)] = report
+        write_json_atomic(os.path.join(directory, "reports.json"), {"version": VERIFY_VERSION, "games": reports})
+    except OSError as e:
+        print("Error saving verification results:", e)
+
+def normalize_search_text(text):
+    text = unicodedata.normalize("NFKD", str(text or "").casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.findall(r"\w+", text))
+
+def _substrings(text, size):
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+class GameSearchIndex:
+    def __init__(self):
+        self.entries = {}
+        self.trigrams = {}
+        self.short_grams = {}
+        self.prefixes = {}
+
+    def _postings(self, name, tokens):
+        yield self.trigrams, _substrings(f" {name} ", 3)
+        yield self.short_grams, _substrings(name, 1) | _substrings(name, 2)
+        yield self.prefixes, {token[:i] for token in tokens for i in range(1, len(token) + 1)}
+
+    def add(self, games):
+        for game in games:
+            key = game_key(game)
+            self.remove(key)
+            name = normalize_search_text(game["name"])
+            tokens = set(name.split())
+            for field in (game.get("installdir"), game.get("appid")):
+                tokens.update(normalize_search_text(field).split())
+            for tag in game.get("tags", ()):
+                tokens.update(normalize_search_text(tag).split())
+            if game.get("update"):
+                tokens.add("update")
+            self.entries[key] = (name, tokens)
+            for postings, grams in self._postings(name, tokens):
+                for gram in grams:
+                    postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for postings, grams in self._postings(*entry):
+            for gram in grams:
+                keys = postings.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[gram]
+
+    def clear(self):
+        self.__init__()
+
+    def _score(self, key, query):
+        name = self.entries[key][0]
+        if name == query:
+            return 100
+        if name.startswith(query):
+            return 90
+        if (" " + query) in name:
+            return 80
+        if query in name:
+            return 70
+        return 60
+
+    def search(self, query):
+        query = normalize_search_text(query)
+        if not query:
+            return None
+        scores = {}
+
+        def offer(key, score):
+            if score > scores.get(key, 0):
+                scores[key] = score
+
+        # Chaque mot de la requête doit préfixer un mot du nom, de l'installdir, de l'appid ou des tags
+        token_sets = sorted((self.prefixes.get(token, set()) for token in query.split()), key=len)
+        for key in set.intersection(*token_sets):
+            offer(key, self._score(key, query))
+        if len(query) < 3:
+            for key in self.short_grams.get(query, ()):
+                offer(key, self._score(key, query))
+        else:
+            query_grams = _substrings(f" {query} ", 3)
+            shared = {}
+            for gram in query_grams:
+                for key in self.trigrams.get(gram, ()):
+                    shared[key] = shared.get(key, 0) + 1
+            for key, count in shared.items():
+                if query in self.entries[key][0]:
+                    offer(key, self._score(key, query))
+                else:
+                    similarity = count / len(query_grams)
+                    if similarity >= SEARCH_FUZZY_THRESHOLD:
+                        offer(key, 50 * similarity)
+        return sorted(scores, key=lambda k: (-scores[k], len(self.entries[k][0]), self.entries[k][0]))
+
+STEAM_PROCESS_NAMES = {"steam.exe", "steam"}
+STEAM_POLL_INTERVAL = 2.0
+
+class ProcfsProcessBackend:
+    def processes(self):
+        processes = {}
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "comm"), "r") as f:
+                        processes[int(entry.name)] = f.read().strip()
+                except OSError:
+                    continue
+        return processes
+
+    def is_alive(self, pid):
+        return os.path.exists(f"/proc/{pid}")
+
+class Toolhelp32ProcessBackend:
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessEntry32(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD), ("th32DefaultHeapID", ctypes.c_size_t),
+                ("th32ModuleID", wintypes.DWORD), ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD), ("pcPriClassBase", ctypes.c_long),
+                ("dwFlags", wintypes.DWORD), ("szExeFile", ctypes.c_wchar * 260)
+            ]
+
+        self.ctypes = ctypes
+        self.entry_type = ProcessEntry32
+        self.kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self.kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        self.kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+        self.kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessEntry32)]
+        self.kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessEntry32)]
+        self.kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    def processes(self):
+        snapshot = self.kernel32.CreateToolhelp32Snapshot(0x2, 0)
+        if snapshot is None or snapshot == self.ctypes.c_void_p(-1).value:
+            raise OSError(self.ctypes.get_last_error(), "CreateToolhelp32Snapshot failed")
+        processes = {}
+        try:
+            entry = self.entry_type()
+            entry.dwSize = self.ctypes.sizeof(entry)
+            found = self.kernel32.Process32FirstW(snapshot, self.ctypes.byref(entry))
+            while found:
+                processes[entry.th32ProcessID] = entry.szExeFile
+                found = self.kernel32.Process32NextW(snapshot, self.ctypes.byref(entry))
+        finally:
+            self.kernel32.CloseHandle(snapshot)
+        return processes
+
+    def is_alive(self, pid):
+        return pid in self.processes()
+
+class PsProcessBackend:
+    def processes(self):
+        import subprocess
+        output = subprocess.check_output(["ps", "-axo", "pid=,comm="], universal_newlines=True)
+        processes = {}
+        for line in output.splitlines():
+            pid, _, name = line.strip().partition(" ")
+            if pid.isdigit():
+                processes[int(pid)] = os.path.basename(name.strip())
+        return processes
+
+    def is_alive(self, pid):
+        return pid in self.processes()
+
+def default_process_backend():
+    if sys.platform == "win32":
+        return Toolhelp32ProcessBackend()
+    if os.path.isdir("/proc"):
+        return ProcfsProcessBackend()
+    return PsProcessBackend()
+
+def find_steam_pid(backend=None):
     try:
-        output = subprocess.check_output("tasklist", shell=True, universal_newlines=True)
-        return re.search(r"(?i)\bSteam\.exe\b", output) is not None
+        processes = (backend or default_process_backend()).processes()
     except Exception as e:
         print("Error checking Steam process:", e)
-        return False
+        TRACER.instant("steam.check_failed", "steam", error=str(e))
+        return None
+    for pid, name in processes.items():
+        if name.lower() in STEAM_PROCESS_NAMES:
+            return pid
+    return None
 
-def launch_steam(account):
-    if is_steam_running():
+def is_steam_running(backend=None):
+    return find_steam_pid(backend) is not None
+
+def launch_steam(account, steam_running=None):
+    if steam_running is None:
+        steam_running = is_steam_running()
+    if steam_running:
         print("Steam is already running.")
+        TRACER.instant("steam.already_running", "steam", account=account)
         return
     steam_path = r"C:\Program Files (x86)\Steam\Steam.exe"
     if os.path.exists(steam_path):
+        import subprocess
         try:
             subprocess.Popen(
                 [steam_path, '-login', account],
@@ -62,36 +1691,26 @@ def launch_steam(account):
             )
         except Exception as e:
             print("Error launching Steam:", e)
+            TRACER.instant("steam.launch_failed", "steam", error=str(e))
     else:
         print("Steam executable not found at default path.")
+        TRACER.instant("steam.not_found", "steam", path=steam_path)
 
 def parse_loginusers_vdf(filepath):
     profiles = []
-    current_user = {}
-    in_user_block = False
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if re.match(r'^"\d{17}"$', line):
-                    if current_user:
-                        profiles.append(current_user)
-                    current_user = {'SteamID': line.strip('"')}
-                    in_user_block = True
-                elif in_user_block and '"' in line:
-                    parts = re.findall(r'"([^"]+)"', line)
-                    if len(parts) >= 2:
-                        key, value = parts[0], parts[1]
-                        if key == "AccountName":
-                            current_user["AccountName"] = value
-                        elif key == "PersonaName":
-                            current_user["PersonaName"] = value
-                elif line == '}':
-                    in_user_block = False
-            if current_user:
-                profiles.append(current_user)
+        users = load_vdf(filepath, ("users",)) or {}
+        for steam_id, info in users.items():
+            if not isinstance(info, dict):
+                continue
+            profile = {'SteamID': steam_id}
+            for key in ("AccountName", "PersonaName"):
+                if isinstance(info.get(key), str):
+                    profile[key] = info[key]
+            profiles.append(profile)
     except Exception as e:
         print("Error parsing loginusers.vdf:", e)
+        TRACER.instant("vdf.loginusers_failed", "vdf", error=str(e))
     return profiles
 
 def get_steam_profiles():
@@ -101,29 +1720,459 @@ def get_steam_profiles():
             return sorted(profiles, key=lambda x: x.get("PersonaName", "").lower())
     return [{"AccountName": "Default", "PersonaName": "Default"}]
 
+def localconfig_path(account, userdata=None):
+    steam_id = _to_int(account.get("SteamID"))
+    if steam_id <= STEAM_ID64_BASE:
+        return None
+    return os.path.join(userdata or STEAM_USERDATA_PATH, str(steam_id - STEAM_ID64_BASE), "config", "localconfig.vdf")
+
+def parse_localconfig(filepath):
+    sections = load_vdf_sections(filepath, (LOCALCONFIG_APPS_SECTION, LOCALCONFIG_WEBSTORAGE_SECTION))
+    apps = {}
+    for appid, info in (sections.get(LOCALCONFIG_APPS_SECTION) or {}).items():
+        if not isinstance(info, dict):
+            continue
+        fields = {key.lower(): value for key, value in info.items()}
+        last_played, playtime = _to_int(fields.get("lastplayed")), _to_int(fields.get("playtime"))
+        if last_played or playtime:
+            apps[appid] = {"last_played": last_played, "playtime": playtime}
+    favorites = []
+    # Les collections Steam (dont les favoris) sont stockées en JSON dans une valeur de WebStorage
+    collections = (sections.get(LOCALCONFIG_WEBSTORAGE_SECTION) or {}).get("user-collections")
+    if isinstance(collections, str):
+        try:
+            favorites = [str(appid) for appid in json.loads(collections)["favorite"].get("added", [])]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print("Steam collections unreadable:", e)
+    return {"apps": apps, "favorites": favorites}
+
+class ProfileMetadataStore:
+    # Une entrée par profil, reparsée seulement quand localconfig.vdf change de date ou de taille
+    def __init__(self, userdata=None):
+        self.userdata = userdata
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def cached(self, account):
+        with self.lock:
+            entry = self.entries.get(account.get("SteamID"))
+        return entry[1] if entry else None
+
+    def get(self, account):
+        path = localconfig_path(account, self.userdata)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if stat is None:
+            return {"apps": {}, "favorites": []}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            entry = self.entries.get(account.get("SteamID"))
+        if entry and entry[0] == stamp:
+            return entry[1]
+        try:
+            metadata = parse_localconfig(path)
+        except (OSError, VDFError) as e:
+            print("Error parsing localconfig.vdf:", e)
+            metadata = {"apps": {}, "favorites": []}
+        with self.lock:
+            self.entries[account.get("SteamID")] = (stamp, metadata)
+        return metadata
+
+PROFILE_METADATA = ProfileMetadataStore()
+
+CLI_COMMANDS = ("list", "search", "profiles", "launch", "scan")
+CLI_LAUNCH_OPTIONS = ("-nooverlay", "-windowed", "-high", "-lowgfx")
+
+def is_cli_invocation(argv):
+    # L'application ne prend que des options de diagnostic : le reste (commande, aide, options globales) va à la CLI
+    if not argv:
+        return False
+    first = argv[0]
+    return first in CLI_COMMANDS + ("-h", "--help", "--library", "--profile") \
+        or first.startswith(("--library=", "--profile=", "--json"))
+
+def cli_emit(record, as_json, output=None):
+    output = output or sys.stdout
+    if as_json:
+        line = json.dumps(record, ensure_ascii=False)
+    else:
+        line = "\t".join("" if value is None else str(value) for value in record.values())
+    output.write(line + "\n")
+    output.flush()
+
+def cli_game_record(game):
+    return {"name": game.get("name"), "appid": game.get("appid"), "path": game.get("path"),
+            "exe": game.get("exe"), "update": bool(game.get("update")), "size": game.get("size")}
+
+def cli_find_profile(query):
+    key = query.casefold()
+    for profile in get_steam_profiles():
+        if key in (str(profile.get(field, "")).casefold() for field in ("SteamID", "AccountName", "PersonaName")):
+            return profile
+    return None
+
+def cli_library(args):
+    # --library l'emporte ; sinon la bibliothèque du profil demandé (par défaut le premier, comme l'application)
+    if args.profile:
+        account = cli_find_profile(args.profile)
+        if account is None:
+            raise LookupError(f"unknown profile: {args.profile}")
+    else:
+        account = get_steam_profiles()[0]
+    settings = CONFIG.profile_cache_files(account)
+    path = args.library or settings["steam_apps_path"]
+    if not path or not os.path.isdir(path):
+        raise LookupError("no Steam library configured (use --library PATH)")
+    return path, settings
+
+def cli_games(path, settings, cached=True):
+    if cached:
+        games = load_library_snapshot(path, settings["library_snapshot"])
+        if games is not None:
+            yield from games
+            return
+    index = load_library_index(settings["library_index"])
+    games = []
+    for game in iter_libraries(path, index=index):
+        games.append(game)
+        yield game
+    save_library_index(index, settings["library_index"])
+    save_library_snapshot(path, games, settings["library_snapshot"])
+
+def cli_find_game(games, query):
+    key = query.casefold()
+    for game in games:
+        if game.get("appid") == query or str(game.get("name", "")).casefold() == key:
+            return game
+    index = GameSearchIndex()
+    index.add(games)
+    ranked = index.search(query)
+    if not ranked:
+        return None
+    return next(game for game in games if game_key(game) == ranked[0])
+
+def cli_main(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="SteamSimple", description="Steam Simple without the window")
+    parser.add_argument("--json", action="store_true", help="one JSON object per line (NDJSON)")
+    parser.add_argument("--library", help="steamapps/common folder (default: the configured one)")
+    parser.add_argument("--profile", help="use this Steam profile's library (SteamID, account or persona name)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    list_parser = commands.add_parser("list", help="list installed games")
+    list_parser.add_argument("--rescan", action="store_true", help="check the disk instead of the last known list")
+    search_parser = commands.add_parser("search", help="search games by name")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--rescan", action="store_true")
+    commands.add_parser("profiles", help="list Steam profiles")
+    scan_parser = commands.add_parser("scan", help="scan the libraries and refresh the cached list")
+    scan_parser.add_argument("--json", action="store_true", dest="scan_json")
+    launch_parser = commands.add_parser("launch", help="launch a game by appid or name")
+    launch_parser.add_argument("game")
+    launch_parser.add_argument("--params", help="extra launch parameters")
+    for option in CLI_LAUNCH_OPTIONS:
+        launch_parser.add_argument(f"-{option}", action="append_const", const=option, dest="options")
+    launch_parser.add_argument("--no-preset", action="store_true", help="ignore the options saved for this game")
+    launch_parser.add_argument("--prewarm", action="store_true", help="pre-load the game's files first")
+    launch_parser.add_argument("--wait", action="store_true", help="wait for the game to exit and report the session")
+    launch_parser.add_argument("--rescan", action="store_true")
+    args = parser.parse_args(argv)
+    as_json = args.json or getattr(args, "scan_json", False)
+    # Les messages d'erreur du lanceur passent par print() : on les renvoie sur stderr pour garder stdout propre
+    output, sys.stdout = sys.stdout, sys.stderr
+
+    def emit(record):
+        cli_emit(record, as_json, output)
+
+    try:
+        if args.command == "profiles":
+            for profile in get_steam_profiles():
+                emit({"steamid": profile.get("SteamID"), "account": profile.get("AccountName"),
+                      "persona": profile.get("PersonaName")})
+            return 0
+        path, settings = cli_library(args)
+        if args.command in ("list", "scan"):
+            start = time.perf_counter()
+            count = 0
+            for game in cli_games(path, settings, cached=args.command == "list" and not args.rescan):
+                emit(cli_game_record(game))
+                count += 1
+            if args.command == "scan" and as_json:
+                emit({"event": "summary", "games": count, "seconds": round(time.perf_counter() - start, 3)})
+            return 0
+        games = list(cli_games(path, settings, cached=not args.rescan))
+        if args.command == "search":
+            index = GameSearchIndex()
+            index.add(games)
+            by_key = {game_key(game): game for game in games}
+            for rank, key in enumerate((index.search(args.query) or [])[:args.limit]):
+                emit(dict(cli_game_record(by_key[key]), rank=rank))
+            return 0
+        game = cli_find_game(games, args.game)
+        if game is None:
+            print(f"No game matching {args.game!r}", file=sys.stderr)
+            return 1
+        exe = resolve_game_exe(game)
+        if not exe or not os.path.exists(exe):
+            print(f"Executable not found for {game['name']}", file=sys.stderr)
+            return 1
+        params, options = args.params, args.options or []
+        if params is None and not options and not args.no_preset:
+            preset = CONFIG.game_preset(game)
+            params, options = preset.get("params", ""), preset.get("options", [])
+        try:
+            argv = build_launch_argv(exe, params or "", options)
+        except ValueError as e:
+            print(f"Error: invalid launch parameters: {e}", file=sys.stderr)
+            return 2
+        if args.prewarm:
+            stats = warm_files(warmup_plan(game, load_warmup_store()["games"].get(game_key(game))))
+            emit(dict({"event": "warmup"}, **stats))
+        record = run_launch(game, argv, lambda pid, spawn_ms: emit(
+            {"event": "started", "game": game["name"], "pid": pid, "spawn_ms": spawn_ms}), wait=args.wait)
+        if record["error"]:
+            emit({"event": "failed", "game": game["name"], "error": record["error"]})
+            return 1
+        if args.wait:
+            emit({"event": "finished", "game": game["name"], "exit_code": record["exit_code"],
+                  "session_s": record["session_s"]})
+            return record["exit_code"]
+        return 0
+    except LookupError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # Sortie coupée (| head) : rien d'anormal, mais Python ne doit pas réécrire dans le tube à la sortie
+        os.dup2(os.open(os.devnull, os.O_WRONLY), output.fileno())
+        return 0
+    finally:
+        sys.stdout = output
+
+if __name__ == "__main__":
+    # Exécutable figé : un processus de hachage relancé par multiprocessing fait son travail au lieu d'ouvrir l'application
+    import multiprocessing
+    multiprocessing.freeze_support()
+    # La ligne de commande répond avant l'import de PyQt5 : rien de Qt n'est chargé dans ce mode
+    if is_cli_invocation(sys.argv[1:]):
+        sys.exit(cli_main(sys.argv[1:]))
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5.QtCore import QPropertyAnimation, QEasingCurve
+
+class SteamProcessMonitor(QtCore.QThread):
+    steam_started = QtCore.pyqtSignal(int)
+    steam_exited = QtCore.pyqtSignal()
+
+    def __init__(self, backend=None, interval=STEAM_POLL_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.backend = backend or default_process_backend()
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.steam_pid = find_steam_pid(self.backend)
+
+    def is_running(self):
+        return self.steam_pid is not None
+
+    def refresh(self):
+        previous = self.steam_pid
+        try:
+            # Tant que le PID est connu, vérifier qu'il existe suffit : pas d'énumération complète
+            if previous is not None and self.backend.is_alive(previous):
+                return previous
+        except Exception as e:
+            print("Error checking Steam process:", e)
+        pid = find_steam_pid(self.backend)
+        self.steam_pid = pid
+        if pid is not None and pid != previous:
+            self.steam_started.emit(pid)
+        elif pid is None and previous is not None:
+            self.steam_exited.emit()
+        return pid
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.refresh()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wait()
+
+class StartupProfiler(QtCore.QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.painted = False
+
+    def mark(self, label):
+        elapsed = (time.perf_counter() - STARTUP_TIME) * 1000
+        print(f"[startup] {label}: {elapsed:.1f} ms", file=sys.stderr, flush=True)
+
+    def eventFilter(self, obj, event):
+        if not self.painted and event.type() == QtCore.QEvent.Paint and isinstance(obj, QtWidgets.QWidget):
+            self.painted = True
+            self.mark("first paint")
+            QtWidgets.QApplication.instance().removeEventFilter(self)
+        return False
+
+class PooledAnimation(QtCore.QVariantAnimation):
+    def __init__(self, pool):
+        super().__init__()
+        self.pool = pool
+        self.key = None
+        self.on_value = None
+        self.setEasingCurve(QEasingCurve.OutCubic)
+        self.valueChanged.connect(self.on_value_changed)
+        self.finished.connect(self.on_finished)
+
+    def on_value_changed(self, value):
+        if self.on_value:
+            self.on_value(value)
+
+    def on_finished(self):
+        self.pool.release(self)
+
+class AnimationPool:
+    def __init__(self, size=ANIMATION_POOL_SIZE):
+        self.size = size
+        self.enabled = True
+        self.idle = []
+        self.active = {}
+        self.created = 0
+
+    def animate(self, key, start, end, duration, on_value):
+        # Une nouvelle cible pour la même clé reprend l'animation en cours au lieu d'en ajouter une
+        previous = self.active.pop(key, None)
+        if previous:
+            previous.on_value = None
+            previous.stop()
+            self.idle.append(previous)
+        if not self.enabled or duration <= 0:
+            on_value(end)
+            return
+        if self.idle:
+            animation = self.idle.pop()
+        elif self.created < self.size:
+            animation = PooledAnimation(self)
+            self.created += 1
+        else:
+            TRACER.count("animations.pool_exhausted")
+            on_value(end)
+            return
+        animation.key = key
+        animation.on_value = on_value
+        animation.setDuration(duration)
+        animation.setStartValue(float(start))
+        animation.setEndValue(float(end))
+        self.active[key] = animation
+        animation.start()
+
+    def release(self, animation):
+        if self.active.get(animation.key) is animation:
+            del self.active[animation.key]
+        animation.on_value = None
+        self.idle.append(animation)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            for animation in list(self.active.values()):
+                animation.setCurrentTime(animation.duration())
+
+ANIMATIONS = AnimationPool()
+
 class AnimatedStackedWidget(QtWidgets.QStackedWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.animation_duration = 400
+        # Une seule animation, redirigée vers la page entrante à chaque transition
+        self.animation = QPropertyAnimation(self)
+        self.animation.setPropertyName(b"pos")
+        self.animation.setDuration(self.animation_duration)
+        self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.animation.finished.connect(self.on_animation_finished)
+        self.animation_trace = None
 
-    def slide_in(self, direction):
-        current_index = self.currentIndex()
-        next_index = current_index + 1 if direction == "left" else current_index - 1
-        if next_index < 0 or next_index >= self.count():
+    def slide_to(self, next_widget, direction="left"):
+        current_widget = self.currentWidget()
+        if self.animation.state() == QtCore.QAbstractAnimation.Running:
+            # Transition précédente interrompue : sa page est posée à sa place finale
+            self.animation.setCurrentTime(self.animation.duration())
+            self.animation.stop()
+        if current_widget is None or next_widget is current_widget or not ANIMATIONS.enabled:
+            self.setCurrentWidget(next_widget)
             return
-        current_widget = self.widget(current_index)
-        next_widget = self.widget(next_index)
+        self.animation.setDuration(self.animation_duration)
         offset = QtCore.QPoint(self.width() if direction == "left" else -self.width(), 0)
         next_widget.move(current_widget.pos() - offset)
         next_widget.show()
         next_widget.raise_()
-        anim = QPropertyAnimation(next_widget, b"pos")
-        anim.setDuration(self.animation_duration)
-        anim.setEasingCurve(QEasingCurve.OutCubic)
-        anim.setStartValue(next_widget.pos())
-        anim.setEndValue(current_widget.pos())
-        self.setCurrentIndex(next_index)
-        anim.start()
+        self.animation.setTargetObject(next_widget)
+        self.animation.setStartValue(next_widget.pos())
+        self.animation.setEndValue(current_widget.pos())
+        self.setCurrentWidget(next_widget)
+        if TRACER.enabled:
+            self.animation_trace = (TRACER.now(), direction)
+        self.animation.start()
+
+    def on_animation_finished(self):
+        if self.animation_trace:
+            start, direction = self.animation_trace
+            self.animation_trace = None
+            TRACER.complete("animation.slide", start, "ui", direction=direction)
+
+class PageManager:
+    def __init__(self, stack, budget=PAGE_CACHE_BUDGET_BYTES):
+        self.stack = stack
+        self.budget = budget
+        self.pages = OrderedDict()
+        # Pages à ne jamais libérer (l'accueil vers lequel GamePage revient)
+        self.pinned = set()
+
+    def get(self, key):
+        return self.pages.get(key)
+
+    def add(self, key, page):
+        self.pages[key] = page
+        self.stack.addWidget(page)
+        return page
+
+    def show(self, key, direction="left"):
+        page = self.pages[key]
+        self.pages.move_to_end(key)
+        self.stack.slide_to(page, direction)
+        self.evict()
+        return page
+
+    def remove(self, key):
+        page = self.pages.pop(key, None)
+        if page is None:
+            return
+        if hasattr(page, "release"):
+            page.release()
+        self.stack.removeWidget(page)
+        page.deleteLater()
+        TRACER.instant("page.evicted", "ui", page=type(page).__name__)
+
+    def memory_cost(self, page):
+        return page.memory_cost() if hasattr(page, "memory_cost") else PAGE_DEFAULT_COST_BYTES
+
+    def evict(self):
+        # Les pages les moins récemment affichées partent en premier ; la page visible n'est jamais libérée
+        current = self.stack.currentWidget()
+        total = sum(self.memory_cost(page) for page in self.pages.values())
+        for key, page in list(self.pages.items()):
+            if total <= self.budget:
+                break
+            if page is current or key in self.pinned:
+                continue
+            total -= self.memory_cost(page)
+            self.remove(key)
+
+    def release_all(self):
+        for page in self.pages.values():
+            if hasattr(page, "release"):
+                page.release()
 
 class ProfileCard(QtWidgets.QFrame):
     clicked = QtCore.pyqtSignal(dict)
@@ -135,22 +2184,13 @@ class ProfileCard(QtWidgets.QFrame):
     
     def setup_ui(self):
         self.setFixedSize(250, 120)
-        self.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #1e2a38, stop:1 #3a4b5c);
-                border: 2px solid #66c0f4;
-                border-radius: 10px;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        self.setObjectName("profileCard")
         layout = QtWidgets.QVBoxLayout(self)
         layout.setAlignment(QtCore.Qt.AlignCenter)
         self.lblPersona = QtWidgets.QLabel(self.profile.get("PersonaName", "Unknown"))
-        self.lblPersona.setStyleSheet("font-size: 20px; font-weight: bold;")
+        self.lblPersona.setObjectName("personaLabel")
         self.lblAccount = QtWidgets.QLabel(f"Account: {self.profile.get('AccountName', 'N/A')}")
-        self.lblAccount.setStyleSheet("font-size: 16px; color: #66c0f4;")
+        self.lblAccount.setObjectName("accountLabel")
         layout.addWidget(self.lblPersona)
         layout.addWidget(self.lblAccount)
     
@@ -162,23 +2202,34 @@ class ProfileSelectionPage(QtWidgets.QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
+        with TRACER.span("page.build", "ui", page="ProfileSelectionPage"):
+            self.setup_ui()
     
     def setup_ui(self):
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(30, 30, 30, 30)
         header = QtWidgets.QLabel("Select Your Steam Profile")
         header.setAlignment(QtCore.Qt.AlignCenter)
-        header.setStyleSheet("font-size: 32px; font-weight: bold; color: #c6d4df;")
+        header.setObjectName("pageTitle")
         main_layout.addWidget(header)
         
         # Utilisation d'un scroll area pour contenir les cartes
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
         container = QtWidgets.QWidget()
-        grid = QtWidgets.QGridLayout(container)
-        grid.setSpacing(20)
+        self.grid = QtWidgets.QGridLayout(container)
+        self.grid.setSpacing(20)
+        scroll.setWidget(container)
+        main_layout.addWidget(scroll)
         
+        self.error_label = QtWidgets.QLabel("")
+        self.error_label.setObjectName("errorLabel")
+        self.error_label.setAlignment(QtCore.Qt.AlignCenter)
+        main_layout.addWidget(self.error_label)
+        # Les cartes sont créées après la première image de la fenêtre
+        QtCore.QTimer.singleShot(0, self.load_profiles)
+    
+    def load_profiles(self):
         profiles = get_steam_profiles()
         col_count = 3
         row = 0
@@ -186,19 +2237,11 @@ class ProfileSelectionPage(QtWidgets.QWidget):
         for profile in profiles:
             card = ProfileCard(profile)
             card.clicked.connect(self.on_card_clicked)
-            grid.addWidget(card, row, col)
+            self.grid.addWidget(card, row, col)
             col += 1
             if col >= col_count:
                 col = 0
                 row += 1
-        
-        scroll.setWidget(container)
-        main_layout.addWidget(scroll)
-        
-        self.error_label = QtWidgets.QLabel("")
-        self.error_label.setStyleSheet("color: #ff5555; font-size: 16px;")
-        self.error_label.setAlignment(QtCore.Qt.AlignCenter)
-        main_layout.addWidget(self.error_label)
     
     def on_card_clicked(self, profile):
         if profile.get("AccountName"):
@@ -211,27 +2254,28 @@ class SetupPage(QtWidgets.QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
+        with TRACER.span("page.build", "ui", page="SetupPage"):
+            self.setup_ui()
     
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(50, 50, 50, 50)
         header = QtWidgets.QLabel("Configure Steam Path")
         header.setAlignment(QtCore.Qt.AlignCenter)
-        header.setStyleSheet("font-size: 28px; font-weight: bold; color: #c6d4df;")
+        header.setObjectName("setupTitle")
         layout.addWidget(header)
         
         self.path_edit = QtWidgets.QLineEdit()
         self.path_edit.setPlaceholderText("Enter path to steamapps/common...")
-        self.path_edit.setStyleSheet("font-size: 16px; padding: 10px; background-color: #2a475e; border: 1px solid #66c0f4; color: #c6d4df;")
+        self.path_edit.setObjectName("pathEdit")
         
         browse_btn = QtWidgets.QPushButton("Browse Folder")
         browse_btn.clicked.connect(self.browse_folder)
-        browse_btn.setStyleSheet("font-size: 16px; padding: 10px; background-color: #2a475e; border: 1px solid #66c0f4; color: #ffffff;")
+        browse_btn.setObjectName("browseButton")
         
         confirm_btn = QtWidgets.QPushButton("Save Configuration")
         confirm_btn.clicked.connect(self.confirm_path)
-        confirm_btn.setStyleSheet("font-size: 16px; padding: 10px; background-color: #1b2838; border: 1px solid #66c0f4; color: #ffffff;")
+        confirm_btn.setObjectName("confirmButton")
         
         layout.addWidget(self.path_edit)
         layout.addWidget(browse_btn)
@@ -250,207 +2294,1382 @@ class SetupPage(QtWidgets.QWidget):
         else:
             QtWidgets.QMessageBox.warning(self, "Error", "Please select a valid directory")
 
+class LibraryScanWorker(QtCore.QThread):
+    games_found = QtCore.pyqtSignal(list)
+    scan_finished = QtCore.pyqtSignal(bool)
+
+    def __init__(self, steam_apps_path, index_file=None, snapshot_file=None, parent=None):
+        super().__init__(parent)
+        self.steam_apps_path = steam_apps_path
+        self.index_file = index_file
+        self.snapshot_file = snapshot_file
+        self.cancel_event = threading.Event()
+        self.library_index = None
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        scan_start = TRACER.now()
+        index = load_library_index(self.index_file)
+        games = []
+        batch = []
+        last_emit = time.monotonic()
+        for game in iter_libraries(self.steam_apps_path, index=index, cancel=self.cancel_event):
+            games.append(game)
+            batch.append(game)
+            now = time.monotonic()
+            if len(batch) >= SCAN_BATCH_SIZE or now - last_emit >= SCAN_BATCH_INTERVAL:
+                self.games_found.emit(batch)
+                batch = []
+                last_emit = now
+        if batch and not self.cancel_event.is_set():
+            self.games_found.emit(batch)
+        # Un scan annulé ne remplace pas les dossiers des bibliothèques inachevées : l'index reste cohérent
+        save_library_index(index, self.index_file)
+        if not self.cancel_event.is_set():
+            save_library_snapshot(self.steam_apps_path, games, self.snapshot_file)
+        TRACER.complete("scan.total", scan_start, "scan", games=len(games), cancelled=self.cancel_event.is_set())
+        self.library_index = index
+        self.scan_finished.emit(not self.cancel_event.is_set())
+
+class ProfileMetadataWorker(QtCore.QThread):
+    metadata_loaded = QtCore.pyqtSignal(dict, dict)
+
+    def __init__(self, accounts, parent=None):
+        super().__init__(parent)
+        self.accounts = [dict(account) for account in accounts]
+
+    def run(self):
+        for account in self.accounts:
+            with TRACER.span("profile.metadata", "vdf", profile=account.get("PersonaName")):
+                metadata = PROFILE_METADATA.get(account)
+            self.metadata_loaded.emit(account, metadata)
+
+class LibraryRefreshWorker(QtCore.QThread):
+    library_refreshed = QtCore.pyqtSignal(str, dict, dict, list, list, list)
+
+    def __init__(self, libraries, index, known, parent=None):
+        super().__init__(parent)
+        self.libraries = libraries
+        # Copie privée des bibliothèques à rafraîchir : l'index partagé n'est modifié (et écrit) que par le thread GUI
+        self.index = {"libraries": {library_key(path): copy.deepcopy(index["libraries"].get(library_key(path), {}))
+                                    for path in libraries}}
+        self.known = known
+
+    def run(self):
+        for path in self.libraries:
+            try:
+                with TRACER.span("scan.refresh", "scan", path=path):
+                    current, added, removed, updated = refresh_library(path, self.index, self.known.get(path, {}))
+            except OSError as e:
+                print("Error refreshing library:", path, e)
+                continue
+            self.library_refreshed.emit(path, self.index["libraries"][library_key(path)], current, added, removed,
+                                        updated)
+
+class LibraryWatcher(QtCore.QObject):
+    library_changed = QtCore.pyqtSignal(list, list, list)
+
+    def __init__(self, libraries, index, games, index_file=None, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.index_file = index_file
+        self.libraries = {library_key(path): path for path in libraries}
+        self.known = {path: {} for path in libraries}
+        for game in games:
+            path = self.libraries.get(library_key(os.path.dirname(game["path"])))
+            if path is not None:
+                self.known[path][game_key(game)] = game
+        self.owners = {}
+        self.polled = {}
+        self.dirty = set()
+        self.first_change = None
+        self.worker = None
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_path_changed)
+        self.watcher.fileChanged.connect(self.on_path_changed)
+        self.coalesce_timer = QtCore.QTimer(self)
+        self.coalesce_timer.setSingleShot(True)
+        self.coalesce_timer.timeout.connect(self.refresh)
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.timeout.connect(self.poll)
+        for path in libraries:
+            self.watch_library(path)
+
+    def watch_library(self, path):
+        steamapps = os.path.dirname(os.path.normpath(path))
+        wanted = [path, steamapps]
+        try:
+            with os.scandir(steamapps) as entries:
+                wanted.extend(entry.path for entry in entries
+                              if entry.name.lower().startswith("appmanifest_") and entry.name.lower().endswith(".acf"))
+        except OSError:
+            pass
+        for watched in wanted:
+            self.owners[watched] = path
+        already = set(self.watcher.files()) | set(self.watcher.directories())
+        missing = [watched for watched in wanted if watched not in already]
+        failed = set(self.watcher.addPaths(missing)) if missing else set()
+        if path in failed or steamapps in failed:
+            # Pas de notification possible (partage réseau, limite inotify...) : on interroge les dates
+            self.polled[path] = self.folder_mtimes(path)
+            if not self.poll_timer.isActive():
+                self.poll_timer.start(WATCH_POLL_INTERVAL_MS)
+
+    def folder_mtimes(self, path):
+        mtimes = []
+        for folder in (path, os.path.dirname(os.path.normpath(path))):
+            try:
+                mtimes.append(os.stat(folder).st_mtime)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def poll(self):
+        for path, previous in self.polled.items():
+            current = self.folder_mtimes(path)
+            if current != previous:
+                self.polled[path] = current
+                self.mark_dirty(path)
+
+    def on_path_changed(self, changed_path):
+        path = self.owners.get(changed_path)
+        if path is not None:
+            self.mark_dirty(path)
+
+    def mark_dirty(self, path):
+        self.dirty.add(path)
+        now = time.monotonic()
+        if self.first_change is None:
+            self.first_change = now
+        waited = (now - self.first_change) * 1000
+        self.coalesce_timer.start(max(0, min(WATCH_COALESCE_MS, WATCH_MAX_DELAY_MS - waited)))
+
+    def refresh(self):
+        if self.worker and self.worker.isRunning():
+            # Un rafraîchissement tourne déjà : on repassera à sa fin
+            return
+        if not self.dirty:
+            return
+        libraries, self.dirty, self.first_change = sorted(self.dirty), set(), None
+        self.worker = LibraryRefreshWorker(libraries, self.index, dict(self.known), self)
+        self.worker.library_refreshed.connect(self.on_library_refreshed)
+        self.worker.finished.connect(self.on_refresh_finished)
+        self.worker.start()
+
+    def on_library_refreshed(self, path, library, current, added, removed, updated):
+        self.index["libraries"][library_key(path)] = library
+        self.known[path] = current
+        self.watch_library(path)
+        if added or removed or updated:
+            self.library_changed.emit(added, removed, updated)
+
+    def on_refresh_finished(self):
+        save_library_index(self.index, self.index_file)
+        if self.dirty:
+            self.coalesce_timer.start(WATCH_COALESCE_MS)
+
+    def stop(self):
+        self.coalesce_timer.stop()
+        self.poll_timer.stop()
+        paths = self.watcher.files() + self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
+        if self.worker:
+            self.worker.wait()
+
+HOME_SORT_ORDERS = (("library", "Library order"), ("name", "Name"), ("recent", "Recently played"),
+                    ("playtime", "Playtime"), ("favorites", "Favorites first"))
+
 class HomePage(QtWidgets.QWidget):
     game_selected = QtCore.pyqtSignal(dict)
+    scan_completed = QtCore.pyqtSignal(int)
     
-    def __init__(self, steam_apps_path, account, parent=None):
+    def __init__(self, steam_apps_path, account, index_file=None, snapshot_file=None, parent=None):
         super().__init__(parent)
         self.steam_apps_path = steam_apps_path
         self.account = account
-        self.all_games = scan_games(steam_apps_path)
-        self.setup_ui()
+        self.index_file = index_file
+        self.snapshot_file = snapshot_file
+        self.library_index = None
+        self.scan_worker = None
+        self.scan_seen = set()
+        self.search_index = GameSearchIndex()
+        self.library_watcher = None
+        # Métadonnées déjà préchargées par MainWindow : le tri est disponible dès la construction de la page
+        self.metadata = PROFILE_METADATA.cached(account) or {"apps": {}, "favorites": []}
+        self.metadata_worker = None
+        with TRACER.span("page.build", "ui", page="HomePage") as span:
+            self.setup_ui()
+            snapshot = load_library_snapshot(steam_apps_path, snapshot_file)
+            if snapshot:
+                self.load_games(snapshot)
+            span.set(snapshot_games=len(self.all_games))
+        # Le scan démarre après le premier affichage pour ne pas retarder la première image
+        QtCore.QTimer.singleShot(0, self.start_scan)
     
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         header = QtWidgets.QLabel(f"Welcome, {self.account['PersonaName']}")
-        header.setStyleSheet("font-size: 24px; color: #c6d4df;")
+        header.setObjectName("welcomeTitle")
         header.setAlignment(QtCore.Qt.AlignCenter)
         layout.addWidget(header)
         self.search_bar = QtWidgets.QLineEdit()
         self.search_bar.setPlaceholderText("Search games...")
-        self.search_bar.setStyleSheet("font-size: 16px; padding: 8px; background-color: #2a475e; border: 1px solid #66c0f4; color: #c6d4df;")
-        self.search_bar.textChanged.connect(self.filter_games)
-        layout.addWidget(self.search_bar)
-        self.games_layout = QtWidgets.QGridLayout()
-        self.load_games()
-        scroll = QtWidgets.QScrollArea()
-        scroll.setWidgetResizable(True)
-        content = QtWidgets.QWidget()
-        content.setLayout(self.games_layout)
-        scroll.setWidget(content)
-        layout.addWidget(scroll)
+        self.search_bar.setObjectName("searchBar")
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.filter_games(self.search_bar.text()))
+        self.search_bar.textChanged.connect(self.search_timer.start)
+        search_layout = QtWidgets.QHBoxLayout()
+        search_layout.addWidget(self.search_bar, 1)
+        self.sort_box = QtWidgets.QComboBox()
+        self.sort_box.setObjectName("sortBox")
+        for order, label in HOME_SORT_ORDERS:
+            self.sort_box.addItem(label, order)
+        search_layout.addWidget(self.sort_box)
+        self.disk_usage_btn = QtWidgets.QPushButton("Disk usage")
+        self.disk_usage_btn.setCheckable(True)
+        self.disk_usage_btn.toggled.connect(self.show_disk_usage)
+        search_layout.addWidget(self.disk_usage_btn)
+        layout.addLayout(search_layout)
+        scan_layout = QtWidgets.QHBoxLayout()
+        self.scan_label = QtWidgets.QLabel("")
+        self.scan_label.setObjectName("scanLabel")
+        self.scan_progress = QtWidgets.QProgressBar()
+        self.scan_progress.setRange(0, 0)
+        self.scan_progress.setFixedHeight(8)
+        self.scan_progress.setTextVisible(False)
+        self.scan_cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.scan_cancel_btn.clicked.connect(self.cancel_scan)
+        scan_layout.addWidget(self.scan_label)
+        scan_layout.addWidget(self.scan_progress, 1)
+        scan_layout.addWidget(self.scan_cancel_btn)
+        self.scan_bar = QtWidgets.QWidget()
+        self.scan_bar.setLayout(scan_layout)
+        self.scan_bar.hide()
+        layout.addWidget(self.scan_bar)
+        # Seules les cartes visibles sont peintes par le délégué, quelle que soit la taille de la bibliothèque
+        self.games_model = GameListModel(self)
+        self.games_proxy = GameFilterProxyModel(self)
+        self.games_proxy.setSourceModel(self.games_model)
+        self.sort_box.setCurrentIndex(max(0, self.sort_box.findData(CONFIG.get("home_sort", "library"))))
+        self.sort_box.currentIndexChanged.connect(lambda index: self.set_sort_order(self.sort_box.itemData(index)))
+        self.set_sort_order(self.sort_box.currentData(), save=False)
+        # Jaquettes décodées hors du thread GUI, seulement pour les cartes visibles ou sur le point de l'être
+        self.thumbnails = ThumbnailCache(library_cache_dirs(self.steam_apps_path), parent=self)
+        self.thumbnails.thumbnail_ready.connect(self.games_model.refresh_key)
+        self.games_delegate = GameCardDelegate(self.thumbnails, self)
+        self.games_delegate.launch_clicked.connect(self.game_selected.emit)
+        self.games_view = GameGridView()
+        self.games_view.setViewMode(QtWidgets.QListView.IconMode)
+        self.games_view.setResizeMode(QtWidgets.QListView.Adjust)
+        self.games_view.setMovement(QtWidgets.QListView.Static)
+        self.games_view.setUniformItemSizes(True)
+        self.games_view.setSpacing(GAME_CARD_SPACING)
+        self.games_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.games_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.games_view.setMouseTracking(True)
+        self.games_view.setItemDelegate(self.games_delegate)
+        self.games_delegate.attach(self.games_view)
+        self.games_view.setModel(self.games_proxy)
+        self.games_view.setObjectName("gamesView")
+        # Vue disque construite au premier affichage seulement
+        self.disk_view = None
+        self.views = QtWidgets.QStackedWidget()
+        self.views.addWidget(self.games_view)
+        layout.addWidget(self.views)
+        self.prefetch_timer = QtCore.QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(THUMBNAIL_PREFETCH_DELAY_MS)
+        self.prefetch_timer.timeout.connect(self.prefetch_thumbnails)
+        self.games_view.verticalScrollBar().valueChanged.connect(lambda value: self.prefetch_timer.start())
+        self.games_proxy.layoutChanged.connect(lambda *args: self.prefetch_timer.start())
+        self.games_proxy.modelReset.connect(lambda: self.prefetch_timer.start())
+        self.games_proxy.rowsInserted.connect(lambda *args: self.prefetch_timer.start())
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.prefetch_timer.start()
+    
+    def prefetch_thumbnails(self):
+        # Grille uniforme : les lignes visibles se déduisent de la position de défilement
+        viewport = self.games_view.viewport()
+        pitch_x = GAME_CARD_SIZE.width() + GAME_CARD_SPACING
+        pitch_y = GAME_CARD_SIZE.height() + GAME_CARD_SPACING
+        columns = max(1, (viewport.width() - GAME_CARD_SPACING) // pitch_x)
+        top_row = max(0, self.games_view.verticalScrollBar().value() // pitch_y - 1)
+        page_rows = viewport.height() // pitch_y + 2
+        first = top_row * columns
+        last = min(self.games_proxy.rowCount(), first + page_rows * (1 + THUMBNAIL_PREFETCH_PAGES) * columns)
+        appids = []
+        for row in range(first, last):
+            appid = self.games_proxy.index(row, 0).data(GameListModel.GameRole).get("appid")
+            if appid:
+                appids.append(appid)
+        self.thumbnails.prefetch(appids)
+    
+    def show_disk_usage(self, checked):
+        if checked and self.disk_view is None:
+            self.disk_view = DiskUsageView(self)
+            self.disk_view.set_games(self.all_games)
+            self.disk_view.filter_keys(self.games_proxy.ranks)
+            self.views.addWidget(self.disk_view)
+        self.views.setCurrentWidget(self.disk_view if checked else self.games_view)
+
+    def refresh_disk_usage(self):
+        if self.disk_view:
+            self.disk_view.set_games(self.all_games)
+            self.disk_view.filter_keys(self.games_proxy.ranks)
+
+    def set_sort_order(self, order, save=True):
+        if save:
+            CONFIG.set("home_sort", order)
+        self.games_proxy.set_sort_key(None if order == "library" else self.game_sort_key)
+
+    def game_sort_key(self, game):
+        order = self.sort_box.currentData()
+        name = game["name"].casefold()
+        if order == "name":
+            return (name,)
+        appid = game.get("appid")
+        if order == "favorites":
+            return (appid not in self.metadata["favorites"], name)
+        app = self.metadata["apps"].get(appid) or {}
+        return (-app.get("last_played" if order == "recent" else "playtime", 0), name)
+
+    def load_metadata(self):
+        # Vérifie la date de localconfig.vdf en arrière-plan ; le fichier n'est relu que s'il a changé
+        if self.metadata_worker and self.metadata_worker.isRunning():
+            return
+        self.metadata_worker = ProfileMetadataWorker([self.account], self)
+        self.metadata_worker.metadata_loaded.connect(self.on_metadata_loaded)
+        self.metadata_worker.start()
+
+    def on_metadata_loaded(self, account, metadata):
+        if metadata is self.metadata:
+            return
+        self.metadata = metadata
+        if self.sort_box.currentData() in ("recent", "playtime", "favorites"):
+            self.games_proxy.set_sort_key(self.game_sort_key)
+
+    def start_scan(self):
+        # Les jeux déjà affichés (snapshot ou scan précédent) restent visibles et sont réconciliés
+        self.cancel_scan()
+        self.load_metadata()
+        self.scan_seen = set()
+        self.scan_worker = LibraryScanWorker(self.steam_apps_path, self.index_file, self.snapshot_file, self)
+        self.scan_worker.games_found.connect(self.on_games_found)
+        self.scan_worker.scan_finished.connect(self.on_scan_finished)
+        self.scan_label.setText("Checking library..." if self.all_games else "Scanning library...")
+        self.scan_progress.show()
+        self.scan_cancel_btn.show()
+        self.scan_bar.show()
+        self.scan_worker.start()
+    
+    def cancel_scan(self, wait=False):
+        if self.scan_worker and self.scan_worker.isRunning():
+            self.scan_worker.cancel()
+            self.scan_label.setText("Cancelling...")
+            if wait:
+                self.scan_worker.wait()
+    
+    def on_games_found(self, games):
+        if self.sender() is not self.scan_worker:
+            return
+        self.scan_seen.update(game_key(game) for game in games)
+        self.search_index.add(games)
+        self.games_model.upsert_games(games)
+        if self.games_proxy.ranks is not None:
+            self.filter_games(self.search_bar.text())
+        self.scan_label.setText(f"Scanning library... {len(self.scan_seen)} games")
+    
+    def on_scan_finished(self, completed):
+        worker = self.sender()
+        if worker is not self.scan_worker:
+            return
+        self.library_index = worker.library_index
+        if completed:
+            stale = [key for key in self.games_model.rows if key not in self.scan_seen]
+            for key in stale:
+                self.search_index.remove(key)
+            self.games_model.remove_keys(stale)
+            if stale and self.games_proxy.ranks is not None:
+                self.filter_games(self.search_bar.text())
+            self.scan_bar.hide()
+            self.refresh_disk_usage()
+            self.start_watching()
+            self.scan_completed.emit(len(self.all_games))
+        else:
+            self.scan_progress.hide()
+            self.scan_cancel_btn.hide()
+            self.scan_label.setText(f"Scan cancelled ({len(self.scan_seen)} games)")
+    
+    def start_watching(self):
+        self.stop_watching()
+        libraries = find_library_folders(self.steam_apps_path)
+        self.library_watcher = LibraryWatcher(libraries, self.library_index, self.all_games, self.index_file, self)
+        self.library_watcher.library_changed.connect(self.on_library_changed)
+    
+    def stop_watching(self):
+        if self.library_watcher:
+            self.library_watcher.stop()
+            self.library_watcher.deleteLater()
+            self.library_watcher = None
+    
+    def release(self):
+        self.cancel_scan(wait=True)
+        self.stop_watching()
+        self.thumbnails.shutdown()
+        if self.metadata_worker:
+            self.metadata_worker.wait()
+        if self.disk_view:
+            self.disk_view.release()
+    
+    def memory_cost(self):
+        return PAGE_DEFAULT_COST_BYTES + len(self.all_games) * PAGE_GAME_COST_BYTES + self.thumbnails.memory_cost()
+    
+    def on_library_changed(self, added, removed, updated):
+        changed = added + updated
+        # Steam télécharge la jaquette à l'installation : un jeu sans image peut en avoir une maintenant
+        self.thumbnails.invalidate(game["appid"] for game in changed if game.get("appid"))
+        self.search_index.add(changed)
+        for key in removed:
+            self.search_index.remove(key)
+        self.games_model.upsert_games(changed)
+        self.games_model.remove_keys(removed)
+        if self.games_proxy.ranks is not None:
+            self.filter_games(self.search_bar.text())
+        self.refresh_disk_usage()
+        save_library_snapshot(self.steam_apps_path, list(self.all_games), self.snapshot_file)
+    
+    @property
+    def all_games(self):
+        return self.games_model.games
     
     def load_games(self, games_list=None):
-        if games_list is None:
-            games_list = self.all_games
-        for i in reversed(range(self.games_layout.count())):
-            widget = self.games_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        row, col = 0, 0
-        for game in games_list:
-            widget = GameWidget(game)
-            widget.play_clicked.connect(self.game_selected.emit)
-            self.games_layout.addWidget(widget, row, col)
-            col += 1
-            if col > 2:
-                col = 0
-                row += 1
+        if games_list is not None:
+            self.search_index.clear()
+            self.search_index.add(games_list)
+            self.games_model.set_games(games_list)
+            self.refresh_disk_usage()
+        self.filter_games(self.search_bar.text())
     
     def filter_games(self, text):
-        text = text.lower().strip()
-        filtered = [g for g in self.all_games if text in g["name"].lower()] if text else self.all_games
-        self.load_games(filtered)
+        self.search_timer.stop()
+        with TRACER.span("search.filter", "search", query=text) as span:
+            ranked = self.search_index.search(text)
+            self.games_proxy.set_ranking(ranked)
+            if self.disk_view:
+                self.disk_view.filter_keys(self.games_proxy.ranks)
+            span.set(results=len(self.all_games) if ranked is None else len(ranked))
+
+class VerifyWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(str, "qint64", "qint64")
+    game_verified = QtCore.pyqtSignal(str, dict)
+    verify_finished = QtCore.pyqtSignal(bool)
+
+    def __init__(self, games, parent=None):
+        super().__init__(parent)
+        self.games = [dict(game) for game in games]
+        self.cancel_event = threading.Event()
+        self.last_progress = 0
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        for game in self.games:
+            if self.cancel_event.is_set():
+                break
+            key = game_key(game)
+            with TRACER.span("game.verify", "scan", game=game.get("name")) as span:
+                report, entry = verify_install(game, load_verify_entry(game), self.cancel_event,
+                                               lambda done, total: self.report_progress(key, done, total))
+                span.set(files=report["files"], bytes=report["bytes"], hashed_bytes=report["hashed_bytes"])
+            save_verify_result(game, report, entry)
+            self.game_verified.emit(key, report)
+        self.verify_finished.emit(not self.cancel_event.is_set())
+
+    def report_progress(self, key, done, total):
+        # Un signal par fichier noierait l'interface sur les installations de centaines de milliers de fichiers
+        now = time.perf_counter()
+        if now - self.last_progress >= 0.1 or done == total:
+            self.last_progress = now
+            self.progress.emit(key, done, total)
+
+class SortableItem(QtWidgets.QTableWidgetItem):
+    def __lt__(self, other):
+        return self.data(QtCore.Qt.UserRole) < other.data(QtCore.Qt.UserRole)
+
+class DiskUsageView(QtWidgets.QWidget):
+    COLUMNS = ("Game", "Size", "Files", "Modified", "Missing", "Verified")
+    KeyRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.games = {}
+        self.reports = load_verify_reports()
+        self.verify_worker = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        actions = QtWidgets.QHBoxLayout()
+        self.verify_label = QtWidgets.QLabel("")
+        self.verify_label.setObjectName("scanLabel")
+        self.verify_progress = QtWidgets.QProgressBar()
+        self.verify_progress.setRange(0, 1000)
+        self.verify_progress.setFixedHeight(8)
+        self.verify_progress.setTextVisible(False)
+        self.verify_progress.hide()
+        self.verify_btn = QtWidgets.QPushButton("Verify selected")
+        self.verify_btn.clicked.connect(self.verify_selected)
+        self.verify_all_btn = QtWidgets.QPushButton("Verify all")
+        self.verify_all_btn.clicked.connect(self.verify_all)
+        self.verify_cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.verify_cancel_btn.clicked.connect(self.cancel_verify)
+        self.verify_cancel_btn.hide()
+        actions.addWidget(self.verify_label, 1)
+        actions.addWidget(self.verify_progress, 1)
+        actions.addWidget(self.verify_btn)
+        actions.addWidget(self.verify_all_btn)
+        actions.addWidget(self.verify_cancel_btn)
+        layout.addLayout(actions)
+        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS))
+        self.table.setObjectName("diskTable")
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        self.table.itemSelectionChanged.connect(self.show_details)
+        self.details = QtWidgets.QListWidget()
+        self.details.setObjectName("diskDetails")
+        splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.details)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+        layout.addWidget(splitter)
+
+    def set_games(self, games):
+        self.games = {game_key(game): game for game in games}
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(self.games))
+        for row, (key, game) in enumerate(self.games.items()):
+            item = QtWidgets.QTableWidgetItem(game["name"])
+            item.setData(self.KeyRole, key)
+            self.table.setItem(row, 0, item)
+            self.update_row(row, game, self.reports.get(key))
+        self.table.setSortingEnabled(True)
+
+    def find_row(self, key):
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).data(self.KeyRole) == key:
+                return row
+        return None
+
+    def update_row(self, row, game, report):
+        def cell(column, text, value, flagged=False, tooltip=""):
+            item = SortableItem(text)
+            item.setData(QtCore.Qt.UserRole, value)
+            item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            item.setToolTip(tooltip)
+            if flagged:
+                item.setForeground(QtGui.QColor("#ff5555"))
+            self.table.setItem(row, column, item)
+
+        if report:
+            cell(1, format_size(report["bytes"]), float(report["bytes"]))
+            cell(2, str(report["files"]), report["files"])
+            cell(3, str(report["modified_count"]), report["modified_count"], report["modified_count"] > 0)
+            cell(4, str(report["missing_count"]), report["missing_count"], report["missing_count"] > 0)
+            verified = report["verified"] if report["completed"] else f"{report['verified']} (partial)"
+            cell(5, verified, report["verified"])
+        else:
+            size = game.get("size") or 0
+            cell(1, format_size(size) if size else "", float(size), tooltip="Size reported by Steam, not measured yet")
+            for column in (2, 3, 4):
+                cell(column, "", -1)
+            cell(5, "Never", "")
+
+    def filter_keys(self, keys):
+        for row in range(self.table.rowCount()):
+            self.table.setRowHidden(row, keys is not None and self.table.item(row, 0).data(self.KeyRole) not in keys)
+
+    def selected_keys(self):
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        return [self.table.item(row, 0).data(self.KeyRole) for row in rows]
+
+    def show_details(self):
+        self.details.clear()
+        keys = self.selected_keys()
+        if not keys:
+            return
+        report = self.reports.get(keys[0])
+        if not report:
+            self.details.addItem("Not verified yet")
+            return
+        for label, paths in (("Modified", report["modified"]), ("Missing", report["missing"]),
+                             ("Unreadable", report["errors"])):
+            for path in paths:
+                item = QtWidgets.QListWidgetItem(f"{label}: {path}")
+                item.setForeground(QtGui.QColor("#ff5555"))
+                self.details.addItem(item)
+        for folder, size in report["folders"]:
+            self.details.addItem(f"{format_size(size):>10}  {folder}")
+
+    def verify_selected(self):
+        self.start_verify([self.games[key] for key in self.selected_keys() if key in self.games])
+
+    def verify_all(self):
+        # Dans l'ordre affiché : trier par taille d'abord fait passer les plus grosses installations en premier
+        keys = [self.table.item(row, 0).data(self.KeyRole) for row in range(self.table.rowCount())
+                if not self.table.isRowHidden(row)]
+        self.start_verify([self.games[key] for key in keys if key in self.games])
+
+    def start_verify(self, games):
+        if not games:
+            return
+        self.cancel_verify(wait=True)
+        self.verify_worker = VerifyWorker(games, self)
+        self.verify_worker.progress.connect(self.on_verify_progress)
+        self.verify_worker.game_verified.connect(self.on_game_verified)
+        self.verify_worker.verify_finished.connect(self.on_verify_finished)
+        self.verify_label.setText(f"Verifying {len(games)} games..." if len(games) > 1 else "Verifying...")
+        self.verify_progress.setValue(0)
+        self.verify_progress.show()
+        self.verify_cancel_btn.show()
+        self.verify_worker.start()
+
+    def cancel_verify(self, wait=False):
+        if self.verify_worker and self.verify_worker.isRunning():
+            self.verify_worker.cancel()
+            self.verify_label.setText("Cancelling...")
+            if wait:
+                self.verify_worker.wait()
+
+    def on_verify_progress(self, key, done, total):
+        if self.sender() is not self.verify_worker:
+            return
+        name = self.games[key]["name"] if key in self.games else key
+        self.verify_label.setText(f"Verifying {name}... {format_size(done)} of {format_size(total)}")
+        self.verify_progress.setValue(int(done * 1000 / total) if total else 1000)
+
+    def on_game_verified(self, key, report):
+        self.reports[key] = report
+        row = self.find_row(key)
+        if row is not None:
+            self.table.setSortingEnabled(False)
+            self.update_row(row, self.games[key], report)
+            self.table.setSortingEnabled(True)
+        if key in self.selected_keys()[:1]:
+            self.show_details()
+
+    def on_verify_finished(self, completed):
+        if self.sender() is not self.verify_worker:
+            return
+        self.verify_progress.hide()
+        self.verify_cancel_btn.hide()
+        flagged = sum(1 for key in self.games if (self.reports.get(key) or {}).get("modified_count")
+                      or (self.reports.get(key) or {}).get("missing_count"))
+        status = "Verification done" if completed else "Verification cancelled"
+        if flagged:
+            status += f", modified or missing files in {flagged} game{'s' if flagged > 1 else ''}"
+        self.verify_label.setText(status)
+
+    def release(self):
+        self.cancel_verify(wait=True)
 
 class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self):
+    def __init__(self, startup_profiler=None):
         super().__init__()
+        self.startup_profiler = startup_profiler
         self.setWindowTitle("Steam Simple")
         self.resize(1280, 720)
         self.stack = AnimatedStackedWidget()
         self.setCentralWidget(self.stack)
+        self.pages = PageManager(self.stack)
         self.current_profile = None
         self.steam_apps_path = None
-        if is_steam_running():
+        self.steam_monitor = SteamProcessMonitor(parent=self)
+        self.steam_monitor.steam_started.connect(self.on_steam_started)
+        self.steam_monitor.steam_exited.connect(self.on_steam_exited)
+        self.steam_monitor.start()
+        # Survit aux GamePage : une partie lancée reste suivie après être revenu à l'accueil
+        self.launch_manager = LaunchManager(parent=self)
+        self.launch_manager.launch_finished.connect(self.on_launch_finished)
+        # localconfig.vdf de chaque profil lu d'avance : changer de profil n'attend pas son parsing
+        self.metadata_worker = ProfileMetadataWorker(get_steam_profiles(), self)
+        QtCore.QTimer.singleShot(0, self.metadata_worker.start)
+        if self.steam_monitor.is_running():
             self.current_profile = get_steam_profiles()[0]
-            config = load_config()
-            if 'steam_apps_path' in config and os.path.isdir(config['steam_apps_path']):
-                self.show_home(config['steam_apps_path'])
-            else:
-                self.show_setup()
+            self.show_profile_home()
         else:
             self.show_profile_selection()
+        if self.startup_profiler:
+            self.startup_profiler.mark("window built")
     
     def show_profile_selection(self):
-        self.profile_page = ProfileSelectionPage()
-        self.profile_page.profile_selected.connect(self.on_profile_selected)
-        self.stack.addWidget(self.profile_page)
-        self.stack.setCurrentIndex(0)
+        self.profile_page = self.pages.get("profiles")
+        if self.profile_page is None:
+            self.profile_page = self.pages.add("profiles", ProfileSelectionPage())
+            self.profile_page.profile_selected.connect(self.on_profile_selected)
+        self.pages.show("profiles")
     
     def on_profile_selected(self, profile):
         self.current_profile = profile
-        launch_steam(profile['AccountName'])
-        config = load_config()
-        if 'steam_apps_path' in config and os.path.isdir(config['steam_apps_path']):
-            self.show_home(config['steam_apps_path'])
+        launch_steam(profile['AccountName'], self.steam_monitor.is_running())
+        self.show_profile_home()
+    
+    def show_profile_home(self):
+        # Chaque profil peut avoir sa propre bibliothèque ; sinon celle configurée en dernier
+        path = CONFIG.profile(self.current_profile)["steam_apps_path"]
+        if path and os.path.isdir(path):
+            self.show_home(path)
         else:
             self.show_setup()
     
     def show_setup(self):
-        self.setup_page = SetupPage()
-        self.setup_page.configuration_done.connect(self.on_configuration_done)
-        self.stack.addWidget(self.setup_page)
-        self.stack.slide_in("left")
+        self.setup_page = self.pages.get("setup")
+        if self.setup_page is None:
+            self.setup_page = self.pages.add("setup", SetupPage())
+            self.setup_page.configuration_done.connect(self.on_configuration_done)
+        self.pages.show("setup")
     
     def on_configuration_done(self, path):
-        save_config({'steam_apps_path': path})
+        CONFIG.set('steam_apps_path', path)
+        CONFIG.set_profile(self.current_profile, steam_apps_path=path)
         self.steam_apps_path = path
         self.show_home(path)
     
     def show_home(self, path):
-        self.home_page = HomePage(path, self.current_profile)
-        self.home_page.game_selected.connect(self.show_game_page)
-        self.stack.addWidget(self.home_page)
-        self.stack.slide_in("left")
+        key = ("home", os.path.normcase(os.path.abspath(path)),
+               self.current_profile.get("SteamID") or self.current_profile.get("AccountName"))
+        previous = getattr(self, 'home_page', None)
+        page = self.pages.get(key)
+        if previous and previous is not page:
+            previous.cancel_scan()
+            previous.stop_watching()
+        if page is None:
+            cache_files = CONFIG.profile_cache_files(self.current_profile)
+            page = self.pages.add(key, HomePage(path, self.current_profile, cache_files["library_index"],
+                                                cache_files["library_snapshot"]))
+            page.game_selected.connect(self.show_game_page)
+            if self.startup_profiler:
+                self.startup_profiler.mark(f"home page built ({len(page.all_games)} games from snapshot)")
+                page.scan_completed.connect(
+                    lambda count: self.startup_profiler.mark(f"library checked on disk ({count} games)"))
+        elif page is not previous and not (page.scan_worker and page.scan_worker.isRunning()):
+            # Page reprise du cache : ses jeux restent affichés pendant la vérification sur disque
+            page.start_scan()
+        self.home_page = page
+        self.home_key = key
+        self.pages.pinned = {key}
+        self.pages.show(key)
     
     def show_game_page(self, game_info):
-        if hasattr(self, 'game_page') and self.game_page:
-            self.stack.removeWidget(self.game_page)
-            self.game_page.deleteLater()
-        self.game_page = GamePage(game_info, self.current_profile)
-        self.game_page.back_to_home.connect(self.on_game_page_back)
-        self.stack.addWidget(self.game_page)
-        self.stack.slide_in("left")
+        # Une seule GamePage, rattachée au jeu choisi au lieu d'être reconstruite
+        self.game_page = self.pages.get("game")
+        if self.game_page is None:
+            self.game_page = self.pages.add("game", GamePage(game_info, self.current_profile, self.launch_manager))
+            self.game_page.back_to_home.connect(self.on_game_page_back)
+            self.game_page.exe_resolved.connect(self.on_exe_resolved)
+        else:
+            self.game_page.set_game(game_info)
+        self.pages.show("game")
     
+    def on_exe_resolved(self, game_info):
+        # Le prochain démarrage retrouve l'exe sans reparcourir le dossier du jeu
+        home = getattr(self, 'home_page', None)
+        if not home:
+            return
+        row = home.games_model.rows.get(game_key(game_info))
+        if row is not None:
+            home.games_model.games[row]["exe"] = game_info.get("exe")
+        if home.library_index is not None and set_indexed_exe(home.library_index, game_info):
+            save_library_index(home.library_index, home.index_file)
+        save_library_snapshot(home.steam_apps_path, list(home.all_games), home.snapshot_file)
+
+    def on_launch_finished(self, launch_id, record):
+        if record["error"]:
+            self.statusBar().showMessage(f"{record['game']} failed to start: {record['error']}", 10000)
+        else:
+            self.statusBar().showMessage(f"{record['game']} closed after {format_duration(record['session_s'])} "
+                                         f"(exit code {record['exit_code']})", 10000)
+
+    def on_steam_started(self, pid):
+        self.statusBar().showMessage(f"Steam is running (PID {pid})", 5000)
+
+    def on_steam_exited(self):
+        self.statusBar().showMessage("Steam has exited", 5000)
+
+    def closeEvent(self, event):
+        self.steam_monitor.stop()
+        self.metadata_worker.wait()
+        CONFIG.flush()
+        self.pages.release_all()
+        super().closeEvent(event)
+
     def on_game_page_back(self):
-        self.stack.slide_in("right")
-        if hasattr(self, 'game_page') and self.game_page:
-            self.stack.removeWidget(self.game_page)
-            self.game_page.deleteLater()
-            self.game_page = None
+        # La GamePage reste en cache pour le prochain jeu ; seul son préchargement s'arrête
+        self.game_page.stop_warmup()
+        self.pages.show(self.home_key, "right")
 
-class GameWidget(QtWidgets.QFrame):
-    play_clicked = QtCore.pyqtSignal(dict)
-    
-    def __init__(self, game_info, parent=None):
+GAME_CARD_SIZE = QtCore.QSize(300, 150)
+GAME_CARD_SPACING = 10
+
+class GameListModel(QtCore.QAbstractListModel):
+    GameRole = QtCore.Qt.UserRole + 1
+    UpdateRole = QtCore.Qt.UserRole + 2
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.game_info = game_info
-        self.setup_ui()
-        self.setFixedSize(300, 150)
-        
-    def setup_ui(self):
-        self.setStyleSheet("""
-            GameWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2a475e, stop:1 #171a21);
-                border: 2px solid #66c0f4;
-                border-radius: 8px;
-            }
-        """)
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        name_label = QtWidgets.QLabel(self.game_info["name"])
-        name_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #c6d4df;")
-        name_label.setAlignment(QtCore.Qt.AlignCenter)
-        layout.addWidget(name_label)
-        if self.game_info.get("update"):
-            update_icon = QtWidgets.QLabel()
-            update_icon.setPixmap(QtGui.QPixmap(":/icons/update.png").scaled(24, 24))
-            update_icon.setAlignment(QtCore.Qt.AlignCenter)
-            layout.addWidget(update_icon)
-        play_btn = QtWidgets.QPushButton("Launch")
-        play_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a475e;
-                color: #ffffff;
-                border: 1px solid #66c0f4;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #3b5a70;
-            }
-        """)
-        play_btn.clicked.connect(lambda: self.play_clicked.emit(self.game_info))
-        layout.addWidget(play_btn)
-
-    def enterEvent(self, event):
-        self.animate(True)
-
-    def leaveEvent(self, event):
-        self.animate(False)
-
-    def animate(self, hover):
-        anim = QPropertyAnimation(self, b"geometry")
-        anim.setDuration(200)
-        anim.setEasingCurve(QEasingCurve.OutQuad)
-        curr = self.geometry()
-        if hover:
-            anim.setEndValue(QtCore.QRect(curr.x()-5, curr.y()-5, curr.width()+10, curr.height()+10))
+        self.games = []
+        self.rows = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.games)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        game = self.games[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return game["name"]
+        if role == self.GameRole:
+            return game
+        if role == self.UpdateRole:
+            return bool(game.get("update"))
+        return None
+
+    def set_games(self, games):
+        self.beginResetModel()
+        self.games = list(games)
+        self.rows = {game_key(game): row for row, game in enumerate(self.games)}
+        self.endResetModel()
+
+    def upsert_games(self, games):
+        added = []
+        for game in games:
+            key = game_key(game)
+            row = self.rows.get(key)
+            if row is None:
+                self.rows[key] = len(self.games) + len(added)
+                added.append(game)
+            elif row < len(self.games):
+                self.games[row] = game
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+            else:
+                added[row - len(self.games)] = game
+        if added:
+            first = len(self.games)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            self.games.extend(added)
+            self.endInsertRows()
+
+    def remove_keys(self, keys):
+        rows = sorted((self.rows[key] for key in keys if key in self.rows), reverse=True)
+        if not rows:
+            return
+        for row in rows:
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            del self.games[row]
+            self.endRemoveRows()
+        self.rows = {game_key(game): row for row, game in enumerate(self.games)}
+
+    def refresh_key(self, key):
+        row = self.rows.get(key)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+class GameFilterProxyModel(QtCore.QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ranks = None
+        self.sort_key = None
+
+    def set_ranking(self, ranked_keys):
+        self.ranks = None if ranked_keys is None else {key: i for i, key in enumerate(ranked_keys)}
+        self.invalidate()
+        self.sort(-1 if self.ranks is None and self.sort_key is None else 0)
+
+    def set_sort_key(self, sort_key):
+        # Pendant une recherche l'ordre de pertinence prime ; le tri choisi s'applique au reste du temps
+        self.sort_key = sort_key
+        self.invalidate()
+        self.sort(-1 if self.ranks is None and self.sort_key is None else 0)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.ranks is None:
+            return True
+        return game_key(self.sourceModel().games[source_row]) in self.ranks
+
+    def lessThan(self, left, right):
+        games = self.sourceModel().games
+        if self.ranks is None:
+            return self.sort_key(games[left.row()]) < self.sort_key(games[right.row()])
+        return self.ranks[game_key(games[left.row()])] < self.ranks[game_key(games[right.row()])]
+
+class ThumbnailJob(QtCore.QRunnable):
+    def __init__(self, cache, appid):
+        super().__init__()
+        self.cache = cache
+        self.appid = appid
+
+    def run(self):
+        # Carte sortie de l'écran entre la demande et le début du travail : rien à décoder
+        if self.appid not in self.cache.wanted:
+            self.cache.job_done.emit(self.appid, QtGui.QImage(), False)
+            return
+        with TRACER.span("thumbnail.load", "ui", appid=self.appid) as span:
+            image, origin = self.cache.load_image(self.appid)
+            span.set(origin=origin)
+        self.cache.job_done.emit(self.appid, image, True)
+
+class ThumbnailCache(QtCore.QObject):
+    thumbnail_ready = QtCore.pyqtSignal(str)
+    job_done = QtCore.pyqtSignal(str, QtGui.QImage, bool)
+
+    def __init__(self, cache_dirs, size=GAME_CARD_SIZE, disk_dir=None, disk_bytes=THUMBNAIL_DISK_BYTES,
+                 memory_items=THUMBNAIL_MEMORY_ITEMS, parent=None):
+        super().__init__(parent)
+        self.cache_dirs = cache_dirs
+        self.size = QtCore.QSize(size)
+        self.disk_dir = disk_dir or THUMBNAIL_DIR
+        self.disk_bytes = disk_bytes
+        self.memory_items = memory_items
+        self.memory = OrderedDict()
+        self.missing = set()
+        self.pending = set()
+        self.wanted = set()
+        self.disk_lock = threading.Lock()
+        self.disk_entries = None
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(THUMBNAIL_THREADS)
+        self.job_done.connect(self.on_job_done)
+
+    def pixmap(self, appid):
+        pixmap = self.memory.get(appid)
+        if pixmap is not None:
+            self.memory.move_to_end(appid)
+            return pixmap
+        self.request(appid)
+        return None
+
+    def request(self, appid):
+        self.wanted.add(appid)
+        if appid in self.pending or appid in self.memory or appid in self.missing:
+            return
+        self.pending.add(appid)
+        self.pool.start(ThumbnailJob(self, appid))
+
+    def prefetch(self, appids):
+        # Les demandes en attente pour des cartes qui ne sont plus proches de l'écran seront abandonnées
+        self.wanted = set(appids)
+        for appid in self.wanted:
+            self.request(appid)
+
+    def invalidate(self, appids):
+        for appid in appids:
+            self.memory.pop(appid, None)
+            self.missing.discard(appid)
+
+    def on_job_done(self, appid, image, loaded):
+        self.pending.discard(appid)
+        if not loaded:
+            if appid in self.wanted:
+                self.request(appid)
+            return
+        if image.isNull():
+            self.missing.add(appid)
+            return
+        self.memory[appid] = QtGui.QPixmap.fromImage(image)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+        self.thumbnail_ready.emit(appid)
+
+    def shutdown(self):
+        self.wanted = set()
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def memory_cost(self):
+        return sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8 for pixmap in self.memory.values())
+
+    # Méthodes suivantes : appelées depuis les threads du pool, jamais de QPixmap ici
+    def load_image(self, appid):
+        source, mtime = find_cover_art(appid, self.cache_dirs)
+        if source is None:
+            return QtGui.QImage(), "missing"
+        width, height = self.size.width(), self.size.height()
+        # La date de la jaquette fait partie du nom : une image mise à jour par Steam invalide l'ancienne
+        cached = os.path.join(self.disk_dir, f"{appid}_{mtime}_{width}x{height}.jpg")
+        image = QtGui.QImage(cached)
+        if not image.isNull():
+            self.touch(cached)
+            TRACER.count("thumbnails.disk_hits")
+            return image, "disk"
+        reader = QtGui.QImageReader(source)
+        source_size = reader.size()
+        if source_size.isValid():
+            # Le décodeur JPEG réduit directement : bien moins cher que décoder en pleine taille puis scaled()
+            reader.setScaledSize(source_size.scaled(self.size, QtCore.Qt.KeepAspectRatioByExpanding))
+        image = reader.read()
+        if image.isNull():
+            print("Error decoding cover art:", source, reader.errorString())
+            return image, "missing"
+        if not source_size.isValid():
+            image = image.scaled(self.size, QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation)
+        image = image.copy((image.width() - width) // 2, (image.height() - height) // 2, width, height)
+        TRACER.count("thumbnails.decoded")
+        self.store(appid, cached, image)
+        return image, "decoded"
+
+    def disk_index(self):
+        # Appelé sous disk_lock
+        if self.disk_entries is None:
+            self.disk_entries = {}
+            try:
+                with os.scandir(self.disk_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".jpg"):
+                            stat = entry.stat()
+                            self.disk_entries[entry.path] = [stat.st_size, stat.st_mtime]
+            except OSError:
+                pass
+        return self.disk_entries
+
+    def touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            return
+        with self.disk_lock:
+            entry = self.disk_index().get(path)
+            if entry:
+                entry[1] = time.time()
+
+    def store(self, appid, path, image):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            if not image.save(tmp_path, "JPG", 85):
+                raise OSError("cannot encode thumbnail")
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print("Error writing thumbnail:", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self.disk_lock:
+            entries = self.disk_index()
+            entries[path] = [size, time.time()]
+            prefix = os.path.join(self.disk_dir, f"{appid}_")
+            stale = [old for old in entries if old.startswith(prefix) and old != path]
+            usage = sum(entry[0] for old, entry in entries.items() if old not in stale)
+            if usage > self.disk_bytes:
+                # Les vignettes les moins récemment utilisées partent en premier, jusqu'à 90 % du budget
+                for old, (old_size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+                    if usage <= self.disk_bytes * 0.9:
+                        break
+                    if old != path and old not in stale:
+                        stale.append(old)
+                        usage -= old_size
+            for old in stale:
+                entries.pop(old, None)
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+class GameGridView(QtWidgets.QListView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frame_times = deque(maxlen=FRAME_TIME_SAMPLES)
+
+    def paintEvent(self, event):
+        start = TRACER.now()
+        super().paintEvent(event)
+        self.frame_times.append((TRACER.now() - start) * 1000)
+        TRACER.complete("frame.grid", start, "ui")
+
+def _mix_colors(first, second, ratio):
+    return QtGui.QColor(*(round(a + (b - a) * ratio) for a, b in zip(first.getRgb(), second.getRgb())))
+
+GAME_CARD_COLOR = QtGui.QColor("#2a475e")
+GAME_CARD_HOVER_COLOR = QtGui.QColor("#3b5a70")
+
+class GameCardDelegate(QtWidgets.QStyledItemDelegate):
+    launch_clicked = QtCore.pyqtSignal(dict)
+
+    def __init__(self, thumbnails=None, parent=None):
+        super().__init__(parent)
+        self.thumbnails = thumbnails
+        self.view = None
+        self.hovered = None
+        self.hover_levels = {}
+
+    def attach(self, view):
+        # Survol suivi à la main pour fondre la couleur des cartes au lieu de la changer d'un coup
+        self.view = view
+        view.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.MouseMove:
+            self.set_hovered(self.view.indexAt(event.pos()))
+        elif event.type() == QtCore.QEvent.Leave:
+            self.set_hovered(QtCore.QModelIndex())
+        return False
+
+    def set_hovered(self, index):
+        if self.hovered is not None and self.hovered.isValid() and QtCore.QModelIndex(self.hovered) == index:
+            return
+        if self.hovered is not None and self.hovered.isValid():
+            self.fade(self.hovered, 0.0)
+        self.hovered = QtCore.QPersistentModelIndex(index) if index.isValid() else None
+        if self.hovered is not None:
+            self.fade(self.hovered, 1.0)
+
+    def fade(self, index, target):
+        key = game_key(index.data(GameListModel.GameRole))
+
+        def update(value):
+            if value > 0:
+                self.hover_levels[key] = value
+            else:
+                self.hover_levels.pop(key, None)
+            if index.isValid():
+                self.view.viewport().update(self.view.visualRect(QtCore.QModelIndex(index)))
+
+        ANIMATIONS.animate(("card-hover", id(self), key), self.hover_levels.get(key, 0.0), target, HOVER_FADE_MS, update)
+
+    def sizeHint(self, option, index):
+        return GAME_CARD_SIZE
+
+    def card_rect(self, option):
+        return QtCore.QRectF(option.rect).adjusted(3, 3, -3, -3)
+
+    def button_rect(self, option):
+        card = self.card_rect(option)
+        return QtCore.QRectF(card.left() + 15, card.bottom() - 50, card.width() - 30, 35)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        card = self.card_rect(option)
+        game = index.data(GameListModel.GameRole)
+        if self.view is not None:
+            hover = self.hover_levels.get(game_key(game), 0.0)
         else:
-            anim.setEndValue(curr)
-        anim.start()
+            hover = 1.0 if option.state & QtWidgets.QStyle.State_MouseOver else 0.0
+        appid = game.get("appid")
+        pixmap = self.thumbnails.pixmap(appid) if self.thumbnails and appid else None
+        if pixmap:
+            shape = QtGui.QPainterPath()
+            shape.addRoundedRect(card, 8, 8)
+            painter.save()
+            painter.setClipPath(shape)
+            painter.drawPixmap(card.toRect(), pixmap)
+            # Voile sombre pour garder le nom et le bouton lisibles sur la jaquette
+            shade = QtGui.QLinearGradient(card.topLeft(), card.bottomLeft())
+            shade.setColorAt(0, QtGui.QColor(23, 26, 33, round(130 - 70 * hover)))
+            shade.setColorAt(1, QtGui.QColor(23, 26, 33, 230))
+            painter.fillPath(shape, shade)
+            painter.restore()
+            painter.setBrush(QtCore.Qt.NoBrush)
+        else:
+            gradient = QtGui.QLinearGradient(card.topLeft(), card.bottomLeft())
+            gradient.setColorAt(0, _mix_colors(GAME_CARD_COLOR, GAME_CARD_HOVER_COLOR, hover))
+            gradient.setColorAt(1, QtGui.QColor("#171a21"))
+            painter.setBrush(gradient)
+        painter.setPen(QtGui.QPen(QtGui.QColor("#66c0f4"), 2))
+        painter.drawRoundedRect(card, 8, 8)
+
+        font = QtGui.QFont(option.font)
+        font.setPixelSize(18)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor("#c6d4df"))
+        name_rect = QtCore.QRectF(card.left() + 15, card.top() + 15, card.width() - 30, 40)
+        name = QtGui.QFontMetrics(font).elidedText(index.data(), QtCore.Qt.ElideRight, int(name_rect.width()))
+        painter.drawText(name_rect, QtCore.Qt.AlignCenter, name)
+
+        if index.data(GameListModel.UpdateRole):
+            font.setPixelSize(13)
+            font.setBold(False)
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor("#66c0f4"))
+            painter.drawText(QtCore.QRectF(name_rect.left(), name_rect.bottom(), name_rect.width(), 20),
+                             QtCore.Qt.AlignCenter, "Update available")
+
+        button = self.button_rect(option)
+        painter.setBrush(QtGui.QColor("#2a475e"))
+        painter.setPen(QtGui.QPen(QtGui.QColor("#66c0f4"), 1))
+        painter.drawRoundedRect(button, 4, 4)
+        font = QtGui.QFont(option.font)
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor("#ffffff"))
+        painter.drawText(button, QtCore.Qt.AlignCenter, "Launch")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            if self.button_rect(option).contains(QtCore.QPointF(event.pos())):
+                self.launch_clicked.emit(index.data(GameListModel.GameRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class LaunchManager(QtCore.QObject):
+    launch_queued = QtCore.pyqtSignal(int, dict)
+    launch_started = QtCore.pyqtSignal(int, int, float)
+    launch_failed = QtCore.pyqtSignal(int, str)
+    launch_finished = QtCore.pyqtSignal(int, dict)
+
+    def __init__(self, max_concurrent=LAUNCH_MAX_CONCURRENT, parent=None):
+        super().__init__(parent)
+        self.max_concurrent = max_concurrent
+        self.queue = deque()
+        self.spawning = 0
+        self.running = {}
+        self.next_id = 1
+        self.launch_started.connect(self.on_spawned)
+        self.launch_failed.connect(self.on_spawned)
+        self.launch_finished.connect(self.on_finished)
+
+    def is_running(self, game):
+        key = game_key(game)
+        queued = (queued_game for _, queued_game, _ in self.queue)
+        return any(game_key(other) == key for other in (*self.running.values(), *queued))
+
+    def submit(self, game, argv):
+        launch_id = self.next_id
+        self.next_id += 1
+        self.queue.append((launch_id, dict(game), list(argv)))
+        self.launch_queued.emit(launch_id, game)
+        self.pump()
+        return launch_id
+
+    def pump(self):
+        while self.queue and self.spawning < self.max_concurrent:
+            launch_id, game, argv = self.queue.popleft()
+            self.spawning += 1
+            self.running[launch_id] = game
+            # Un thread par partie : il attend la fin du jeu sans bloquer la boucle d'événements
+            threading.Thread(target=self.supervise, args=(launch_id, game, argv), daemon=True).start()
+
+    def on_spawned(self, launch_id, *args):
+        self.spawning -= 1
+        self.pump()
+
+    def on_finished(self, launch_id, record):
+        self.running.pop(launch_id, None)
+
+    def supervise(self, launch_id, game, argv):
+        try:
+            record = run_launch(game, argv, lambda pid, spawn_ms: self.launch_started.emit(launch_id, pid, spawn_ms))
+        except Exception as e:
+            # Sans launch_finished le jeu resterait « en cours » pour toujours
+            record = {"game": game.get("name"), "appid": game.get("appid"), "argv": argv, "spawn_ms": None,
+                      "session_s": None, "exit_code": None, "error": str(e) or type(e).__name__}
+        if record["error"]:
+            self.launch_failed.emit(launch_id, record["error"])
+        self.launch_finished.emit(launch_id, record)
+
+class WarmupWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal("qint64", int)
+    exe_found = QtCore.pyqtSignal(dict)
+    warmup_finished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, game, entry=None, parent=None):
+        super().__init__(parent)
+        self.game = dict(game)
+        self.entry = entry
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        with TRACER.span("game.warmup", "launch", game=self.game.get("name")) as span:
+            known_exe = self.game.get("exe")
+            plan = warmup_plan(self.game, self.entry, cancel=self.cancel_event)
+            if self.game.get("exe") != known_exe:
+                self.exe_found.emit(self.game)
+            stats = warm_files(plan, self.cancel_event, progress=self.progress.emit)
+            span.set(**stats)
+        TRACER.count("warmup.bytes", stats["bytes"])
+        TRACER.count("warmup.files", stats["files"])
+        self.warmup_finished.emit(stats)
 
 class GamePage(QtWidgets.QWidget):
     back_to_home = QtCore.pyqtSignal()
+    exe_resolved = QtCore.pyqtSignal(dict)
     
-    def __init__(self, game_info, account, parent=None):
+    def __init__(self, game_info, account, launch_manager=None, parent=None):
         super().__init__(parent)
         self.game_info = game_info
         self.account = account
-        self.setup_ui()
+        self.warmup_worker = None
+        self.launch_manager = launch_manager or LaunchManager(parent=QtWidgets.QApplication.instance())
+        self.launch_manager.launch_started.connect(self.on_launch_started)
+        self.launch_manager.launch_failed.connect(self.on_launch_failed)
+        self.launch_manager.launch_finished.connect(self.on_launch_finished)
+        self.launch_id = None
+        self.launch_started_at = None
+        with TRACER.span("page.build", "ui", page="GamePage"):
+            self.setup_ui()
+            self.set_game(game_info)
+    
+    def set_game(self, game_info):
+        # Page réutilisée d'un jeu à l'autre : seul ce qui dépend du jeu est remis à jour
+        with TRACER.span("page.rebind", "ui", page="GamePage", game=game_info["name"]):
+            self.stop_warmup()
+            self.game_info = game_info
+            self.launch_id = None
+            self.launch_started_at = None
+            self.name_label.setText(game_info["name"])
+            self.warmup_label.setText("")
+            self.launch_label.setText("")
+            # Les options choisies pour ce jeu sont retrouvées à la prochaine visite
+            preset = CONFIG.game_preset(game_info)
+            widgets = [self.params_edit] + [chk for chk, _ in self.option_boxes]
+            for widget in widgets:
+                widget.blockSignals(True)
+            self.params_edit.setText(preset.get("params", ""))
+            for chk, option in self.option_boxes:
+                chk.setChecked(option in preset.get("options", ()))
+            for widget in widgets:
+                widget.blockSignals(False)
+        # Le préchargement tourne pendant que l'utilisateur choisit ses options
+        if self.chk_prewarm.isChecked():
+            self.start_warmup()
+    
+    def release(self):
+        self.stop_warmup(wait=True)
     
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         back_btn = QtWidgets.QPushButton("← Back")
-        back_btn.setStyleSheet("font-size: 16px; color: #c6d4df;")
+        back_btn.setObjectName("backButton")
         back_btn.clicked.connect(self.back_to_home.emit)
         layout.addWidget(back_btn)
         content = QtWidgets.QVBoxLayout()
         content.setAlignment(QtCore.Qt.AlignCenter)
-        name_label = QtWidgets.QLabel(self.game_info["name"])
-        name_label.setStyleSheet("font-size: 32px; font-weight: bold; color: #c6d4df;")
-        content.addWidget(name_label)
+        self.name_label = QtWidgets.QLabel()
+        self.name_label.setObjectName("pageTitle")
+        content.addWidget(self.name_label)
         params_layout = QtWidgets.QVBoxLayout()
         params_layout.addWidget(QtWidgets.QLabel("Launch Options:"))
         self.params_edit = QtWidgets.QLineEdit()
@@ -464,79 +3683,274 @@ class GamePage(QtWidgets.QWidget):
         self.chk_windowed = QtWidgets.QCheckBox("Windowed Mode (-windowed)")
         self.chk_high = QtWidgets.QCheckBox("High Performance Mode (-high)")
         self.chk_lowgfx = QtWidgets.QCheckBox("Low Graphics Mode (-lowgfx)")
-        for chk in (self.chk_no_overlay, self.chk_windowed, self.chk_high, self.chk_lowgfx):
-            chk.setStyleSheet("color: #c6d4df; font-size: 14px;")
+        self.chk_prewarm = QtWidgets.QCheckBox("Pre-load game files before launch (faster start from HDD)")
+        self.chk_prewarm.setChecked(bool(CONFIG.get("prewarm")))
+        self.chk_prewarm.toggled.connect(self.on_prewarm_toggled)
+        for chk in (self.chk_no_overlay, self.chk_windowed, self.chk_high, self.chk_lowgfx, self.chk_prewarm):
+            chk.setObjectName("launchOption")
             advanced_layout.addWidget(chk)
         content.addWidget(advanced_group)
+        self.option_boxes = ((self.chk_no_overlay, "-nooverlay"), (self.chk_windowed, "-windowed"),
+                             (self.chk_high, "-high"), (self.chk_lowgfx, "-lowgfx"))
+        for chk, _ in self.option_boxes:
+            chk.toggled.connect(self.save_preset)
+        self.params_edit.textChanged.connect(self.save_preset)
         launch_btn = QtWidgets.QPushButton("Start Game")
         launch_btn.setFixedSize(200, 40)
         launch_btn.clicked.connect(self.launch_game)
         content.addWidget(launch_btn, 0, QtCore.Qt.AlignCenter)
+        self.warmup_label = QtWidgets.QLabel("")
+        self.warmup_label.setObjectName("statusLabel")
+        content.addWidget(self.warmup_label, 0, QtCore.Qt.AlignCenter)
+        self.launch_label = QtWidgets.QLabel("")
+        self.launch_label.setObjectName("statusLabel")
+        content.addWidget(self.launch_label, 0, QtCore.Qt.AlignCenter)
         layout.addLayout(content)
     
-    def launch_game(self):
-        exe = self.game_info.get("exe")
-        if not exe or not os.path.exists(exe):
-            QtWidgets.QMessageBox.warning(self, "Error", "Executable not found!")
-            return
-        params = self.params_edit.text().strip()
-        advanced_args = ""
-        if self.chk_no_overlay.isChecked():
-            advanced_args += " -nooverlay"
-        if self.chk_windowed.isChecked():
-            advanced_args += " -windowed"
-        if self.chk_high.isChecked():
-            advanced_args += " -high"
-        if self.chk_lowgfx.isChecked():
-            advanced_args += " -lowgfx"
-        full_params = (params + advanced_args).strip()
-        if not full_params:
-            try:
-                os.startfile(exe)
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch game:\n{e}")
+    def selected_options(self):
+        return [option for chk, option in self.option_boxes if chk.isChecked()]
+    
+    def save_preset(self):
+        CONFIG.set_game_preset(self.game_info, {"params": self.params_edit.text().strip(),
+                                                "options": self.selected_options()})
+    
+    def on_prewarm_toggled(self, checked):
+        CONFIG.set("prewarm", checked)
+        if checked:
+            self.start_warmup()
         else:
-            cmd = f'"{exe}" {full_params}'
+            self.stop_warmup()
+            self.warmup_label.setText("")
+    
+    def start_warmup(self):
+        if self.warmup_worker:
+            return
+        entry = load_warmup_store()["games"].get(game_key(self.game_info))
+        self.warmup_worker = WarmupWorker(self.game_info, entry, self)
+        self.warmup_worker.progress.connect(self.on_warmup_progress)
+        self.warmup_worker.exe_found.connect(self.on_warmup_exe_found)
+        self.warmup_worker.warmup_finished.connect(self.on_warmup_finished)
+        self.warmup_worker.finished.connect(self.on_warmup_thread_finished)
+        self.warmup_label.setText("Pre-loading game files...")
+        self.warmup_worker.start()
+    
+    def stop_warmup(self, wait=False):
+        # Un worker annulé se termine seul en arrière-plan : on ne l'attend que lorsque la page est libérée
+        if self.warmup_worker:
+            self.warmup_worker.cancel()
+            self.warmup_worker = None
+        if wait:
+            for worker in self.findChildren(WarmupWorker):
+                worker.wait()
+    
+    def on_warmup_thread_finished(self):
+        worker = self.sender()
+        if worker is self.warmup_worker:
+            self.warmup_worker = None
+        worker.deleteLater()
+    
+    def on_warmup_exe_found(self, game):
+        if game_key(game) == game_key(self.game_info):
+            self.game_info["exe"] = game["exe"]
+            game = self.game_info
+        self.exe_resolved.emit(game)
+    
+    def on_warmup_progress(self, read, files):
+        if self.sender() is self.warmup_worker:
+            self.warmup_label.setText(f"Pre-loading game files... {read / (1 << 20):.0f} MB ({files} files)")
+    
+    def on_warmup_finished(self, stats):
+        if self.sender() is not self.warmup_worker:
+            return
+        done = "Pre-loaded" if stats["completed"] else "Pre-load stopped at"
+        self.warmup_label.setText(f"{done} {stats['bytes'] / (1 << 20):.0f} MB of "
+                                  f"{stats['planned_bytes'] / (1 << 20):.0f} MB ({stats['files']} files) "
+                                  f"in {stats['seconds']:.1f} s")
+    
+    def launch_game(self):
+        with TRACER.span("game.launch", "launch", game=self.game_info["name"]):
+            known_exe = self.game_info.get("exe")
+            exe = resolve_game_exe(self.game_info)
+            if exe and exe != known_exe:
+                self.exe_resolved.emit(self.game_info)
+            if not exe or not os.path.exists(exe):
+                QtWidgets.QMessageBox.warning(self, "Error", "Executable not found!")
+                return
             try:
-                subprocess.Popen(cmd, shell=True)
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch game:\n{e}")
+                argv = build_launch_argv(exe, self.params_edit.text().strip(), self.selected_options())
+            except ValueError as e:
+                QtWidgets.QMessageBox.warning(self, "Error", f"Invalid launch options:\n{e}")
+                return
+            if self.launch_manager.is_running(self.game_info):
+                self.launch_label.setText("This game is already running")
+                return
+            # Le jeu a besoin du disque pour lui seul : le préchargement s'arrête là où il en est
+            self.stop_warmup()
+            self.launch_started_at = time.time()
+            self.launch_id = self.launch_manager.submit(self.game_info, argv)
+            self.launch_label.setText("Starting...")
+    
+    def on_launch_started(self, launch_id, pid, spawn_ms):
+        if launch_id != self.launch_id:
+            return
+        self.launch_label.setText(f"Running (PID {pid}, started in {spawn_ms:.0f} ms)")
+        if self.chk_prewarm.isChecked():
+            # Apprend les fichiers lus par le jeu pour les précharger au prochain lancement
+            threading.Thread(target=learn_launch_files, args=(dict(self.game_info), pid, self.launch_started_at),
+                             daemon=True).start()
+    
+    def on_launch_failed(self, launch_id, error):
+        if launch_id == self.launch_id:
+            self.launch_label.setText("")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch game:\n{error}")
+    
+    def on_launch_finished(self, launch_id, record):
+        if launch_id == self.launch_id and record["exit_code"] is not None:
+            self.launch_label.setText(f"Session ended after {format_duration(record['session_s'])} "
+                                      f"(exit code {record['exit_code']})")
+
+# Feuille de style unique, appliquée une fois à l'application : les widgets ne portent qu'un objectName
+APP_STYLESHEET = """
+    QWidget {
+        background-color: #171a21;
+        color: #c6d4df;
+        font-family: Arial, sans-serif;
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #2a475e;
+        color: #c6d4df;
+        border: 1px solid #66c0f4;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #3b5a70;
+    }
+    QLineEdit {
+        background-color: #2a475e;
+        border: 1px solid #66c0f4;
+        border-radius: 4px;
+        color: #c6d4df;
+        padding: 4px 8px;
+    }
+    QScrollArea {
+        background-color: #171a21;
+        border: none;
+    }
+    QHeaderView::section {
+        background-color: #2a475e;
+        color: #ffffff;
+    }
+    QFrame#profileCard, QFrame#profileCard QLabel {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #1e2a38, stop:1 #3a4b5c);
+        border: 2px solid #66c0f4;
+        border-radius: 10px;
+        color: #ffffff;
+    }
+    QLabel#personaLabel {
+        font-size: 20px;
+        font-weight: bold;
+    }
+    QLabel#accountLabel {
+        font-size: 16px;
+        color: #66c0f4;
+    }
+    QLabel#pageTitle {
+        font-size: 32px;
+        font-weight: bold;
+        color: #c6d4df;
+    }
+    QLabel#setupTitle {
+        font-size: 28px;
+        font-weight: bold;
+        color: #c6d4df;
+    }
+    QLabel#welcomeTitle {
+        font-size: 24px;
+        color: #c6d4df;
+    }
+    QLabel#errorLabel {
+        color: #ff5555;
+        font-size: 16px;
+    }
+    QLineEdit#pathEdit, QLineEdit#searchBar {
+        font-size: 16px;
+        padding: 10px;
+        background-color: #2a475e;
+        border: 1px solid #66c0f4;
+        color: #c6d4df;
+    }
+    QLineEdit#searchBar {
+        padding: 8px;
+    }
+    QPushButton#browseButton, QPushButton#confirmButton {
+        font-size: 16px;
+        padding: 10px;
+        background-color: #2a475e;
+        border: 1px solid #66c0f4;
+        color: #ffffff;
+    }
+    QPushButton#confirmButton {
+        background-color: #1b2838;
+    }
+    QLabel#scanLabel {
+        font-size: 14px;
+        color: #66c0f4;
+    }
+    QListView#gamesView {
+        background-color: #171a21;
+        border: none;
+    }
+    QPushButton#backButton {
+        font-size: 16px;
+        color: #c6d4df;
+    }
+    QCheckBox#launchOption {
+        color: #c6d4df;
+        font-size: 14px;
+    }
+    QTableWidget#diskTable, QListWidget#diskDetails {
+        background-color: #1b2838;
+        border: none;
+        selection-background-color: #2a475e;
+    }
+    QPushButton:checked {
+        background-color: #66c0f4;
+        color: #171a21;
+    }
+    QLabel#statusLabel {
+        font-size: 13px;
+        color: #66c0f4;
+    }
+"""
 
 if __name__ == "__main__":
+    profile_startup = "--startup-profile" in sys.argv
+    if profile_startup:
+        sys.argv.remove("--startup-profile")
+    # Machines modestes : transitions et survols sans animation
+    if "--no-animations" in sys.argv or CONFIG.get("animations") is False:
+        if "--no-animations" in sys.argv:
+            sys.argv.remove("--no-animations")
+        ANIMATIONS.set_enabled(False)
+    if "--trace" in sys.argv or os.environ.get("STEAM_SIMPLE_TRACE"):
+        if "--trace" in sys.argv:
+            sys.argv.remove("--trace")
+        TRACER.enable()
     app = QtWidgets.QApplication(sys.argv)
-    app.setStyleSheet("""
-        QWidget {
-            background-color: #171a21;
-            color: #c6d4df;
-            font-family: Arial, sans-serif;
-            font-size: 14px;
-        }
-        QPushButton {
-            background-color: #2a475e;
-            color: #c6d4df;
-            border: 1px solid #66c0f4;
-            border-radius: 4px;
-            padding: 6px 12px;
-        }
-        QPushButton:hover {
-            background-color: #3b5a70;
-        }
-        QLineEdit {
-            background-color: #2a475e;
-            border: 1px solid #66c0f4;
-            border-radius: 4px;
-            color: #c6d4df;
-            padding: 4px 8px;
-        }
-        QScrollArea {
-            background-color: #171a21;
-            border: none;
-        }
-        QHeaderView::section {
-            background-color: #2a475e;
-            color: #ffffff;
-        }
-    """)
-    window = MainWindow()
+    if TRACER.enabled:
+        metrics_timer = QtCore.QTimer(app)
+        metrics_timer.timeout.connect(TRACER.write_metrics)
+        metrics_timer.start(TRACE_METRICS_INTERVAL_MS)
+        app.aboutToQuit.connect(TRACER.write_metrics)
+        app.aboutToQuit.connect(TRACER.export_chrome_trace)
+    startup_profiler = None
+    if profile_startup:
+        startup_profiler = StartupProfiler(app)
+        startup_profiler.mark("Qt initialised")
+        app.installEventFilter(startup_profiler)
+    app.setStyleSheet(APP_STYLESHEET)
+    window = MainWindow(startup_profiler)
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,146 @@
+import argparse, gc, json, os, platform, resource, sys, tempfile, time, tracemalloc
+from synthetic import load_launcher, make_library, write_loginusers
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SEARCH_QUERIES = ["h", "ha", "half", "half life", "witcher 12", "souls ring", "stardw", "zzzz", ""]
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def measure(name, func, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    # Passe séparée pour la mémoire : tracemalloc fausserait les temps
+    if setup:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {
+        "name": name,
+        "runs": repeat,
+        "min_ms": min(samples),
+        "mean_ms": sum(samples) / len(samples),
+        "p50_ms": percentile(samples, 50),
+        "p90_ms": percentile(samples, 90),
+        "p99_ms": percentile(samples, 99),
+        "max_ms": max(samples),
+        "peak_alloc_bytes": peak
+    }
+    print(f"{name:<45} p50 {result['p50_ms']:9.2f} ms  p90 {result['p90_ms']:9.2f} ms  "
+          f"peak {peak / 1024:9.1f} KiB", file=sys.stderr)
+    return result
+
+def compare(report, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+    for result in report["results"]:
+        previous = baseline.get(result["name"])
+        if previous:
+            ratio = result["p50_ms"] / previous["p50_ms"] if previous["p50_ms"] else float("inf")
+            print(f"{result['name']:<45} p50 {previous['p50_ms']:9.2f} -> {result['p50_ms']:9.2f} ms "
+                  f"({ratio:5.2f}x)", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Steam Simple hot paths on a synthetic Steam library")
+    parser.add_argument("--games", type=int, default=300)
+    parser.add_argument("--depth", type=int, default=3, help="directory levels above each game's exe")
+    parser.add_argument("--files", type=int, default=20, help="files per directory level")
+    parser.add_argument("--manifest-ratio", type=float, default=0.8)
+    parser.add_argument("--profiles", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="JSON results file (default: stdout)")
+    parser.add_argument("--compare", help="previous JSON results to compare p50 latencies against")
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    from PyQt5 import QtCore, QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        common = make_library(os.path.join(tmp, "Steam"), args.games, args.depth, args.files, args.manifest_ratio)
+        loginusers = os.path.join(tmp, "loginusers.vdf")
+        write_loginusers(loginusers, args.profiles)
+        print(f"synthetic library generated in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+        launcher.STEAM_CONFIG_PATH = loginusers
+        launcher.STEAM_LIBRARY_FOLDERS_PATH = os.path.join(tmp, "missing.vdf")
+        launcher.LIBRARY_INDEX_FILE = os.path.join(tmp, "index.json")
+        launcher.LIBRARY_SNAPSHOT_FILE = os.path.join(tmp, "snapshot.json")
+        launcher.THUMBNAIL_DIR = os.path.join(tmp, "thumbnails")
+        # HomePage lit et migre la configuration : jamais celle de l'utilisateur
+        launcher.CONFIG = launcher.ConfigStore(os.path.join(tmp, "config.json"))
+
+        results.append(measure("scan_games (manifests)", lambda: launcher.scan_games(common), args.repeat))
+        results.append(measure("scan_games (os.walk only)",
+                               lambda: launcher.scan_games(common, use_manifests=False), args.repeat))
+        index = launcher.load_library_index()
+        launcher.scan_games(common, index=index)
+        results.append(measure("scan_games (warm library index)",
+                               lambda: launcher.scan_games(common, index=index), args.repeat))
+        results.append(measure("scan_libraries", lambda: launcher.scan_libraries(common), args.repeat))
+        results.append(measure("parse_loginusers_vdf",
+                               lambda: launcher.parse_loginusers_vdf(loginusers), args.repeat))
+        results.append(measure("get_steam_profiles", launcher.get_steam_profiles, args.repeat))
+
+        games = launcher.scan_games(common)
+        # Chemin inexistant : le scan différé de HomePage se termine à vide et ne touche pas aux jeux chargés
+        home = launcher.HomePage(os.path.join(tmp, "no-library"), {"PersonaName": "Benchmark"})
+        home.resize(1280, 720)
+        home.show()
+        deadline = time.monotonic() + 5
+        while (home.scan_worker is None or home.scan_worker.isRunning()) and time.monotonic() < deadline:
+            app.processEvents()
+        app.processEvents()
+
+        def load_and_paint():
+            home.load_games(games)
+            home.games_view.viewport().repaint()
+
+        results.append(measure("HomePage.load_games (+ paint)", load_and_paint, args.repeat,
+                               setup=lambda: home.load_games([])))
+        home.load_games(games)
+
+        def filter_all():
+            for query in SEARCH_QUERIES:
+                home.filter_games(query)
+
+        results.append(measure(f"HomePage.filter_games ({len(SEARCH_QUERIES)} queries)", filter_all, args.repeat))
+        home.close()
+
+    report = {
+        "version": 1,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt": QtCore.QT_VERSION_STR,
+        "parameters": vars(args),
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "results": results
+    }
+    if args.compare:
+        compare(report, args.compare)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import argparse, json, os, platform, sys, tempfile, time
+from synthetic import game_name, load_launcher, write_loginusers
+from bench_hotpaths import measure, percentile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Styles par widget tels qu'ils étaient avant la feuille de style unique, pour mesurer l'écart
+LEGACY_CARD_STYLE = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #1e2a38, stop:1 #3a4b5c);
+        border: 2px solid #66c0f4;
+        border-radius: 10px;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+"""
+
+def frame_stats(name, frames):
+    result = {
+        "name": name,
+        "frames": len(frames),
+        "p50_ms": percentile(frames, 50),
+        "p90_ms": percentile(frames, 90),
+        "p99_ms": percentile(frames, 99),
+        "max_ms": max(frames),
+        "over_16ms": sum(1 for frame in frames if frame > 1000 / 60)
+    }
+    print(f"{name:<45} p50 {result['p50_ms']:9.2f} ms  p99 {result['p99_ms']:9.2f} ms  "
+          f"> 16.7 ms: {result['over_16ms']}/{len(frames)}", file=sys.stderr)
+    return result
+
+def write_cover_art(cache_dir, games):
+    from PyQt5 import QtGui
+    os.makedirs(cache_dir, exist_ok=True)
+    for i in range(games):
+        image = QtGui.QImage(460, 215, QtGui.QImage.Format_RGB32)
+        image.fill(QtGui.QColor.fromHsv(i * 37 % 360, 120, 180))
+        image.save(os.path.join(cache_dir, f"{100000 + i}_header.jpg"), "JPG", 85)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Steam Simple frame times and page build costs offscreen")
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--profiles", type=int, default=60)
+    parser.add_argument("--frames", type=int, default=300, help="scroll steps per grid run")
+    parser.add_argument("--step", type=int, default=24, help="pixels scrolled per frame")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON results file (default: stdout)")
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    from PyQt5 import QtCore, QtGui, QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app.setStyleSheet(launcher.APP_STYLESHEET)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        steam = os.path.join(tmp, "Steam")
+        write_cover_art(os.path.join(steam, "appcache", "librarycache"), args.games)
+        loginusers = os.path.join(tmp, "loginusers.vdf")
+        write_loginusers(loginusers, args.profiles)
+        launcher.STEAM_CONFIG_PATH = loginusers
+        launcher.STEAM_LIBRARY_FOLDERS_PATH = os.path.join(tmp, "missing.vdf")
+        launcher.LIBRARY_INDEX_FILE = os.path.join(tmp, "index.json")
+        launcher.LIBRARY_SNAPSHOT_FILE = os.path.join(tmp, "snapshot.json")
+        launcher.THUMBNAIL_DIR = os.path.join(tmp, "thumbnails")
+        # HomePage lit et migre la configuration : jamais celle de l'utilisateur
+        launcher.CONFIG = launcher.ConfigStore(os.path.join(tmp, "config.json"))
+
+        def build_profiles():
+            page = launcher.ProfileSelectionPage()
+            page.resize(1280, 720)
+            page.load_profiles()
+            page.grab()
+            page.deleteLater()
+
+        results.append(measure(f"ProfileSelectionPage ({args.profiles} cards, app style)", build_profiles, args.repeat))
+        original_setup = launcher.ProfileCard.setup_ui
+
+        def legacy_setup(card):
+            original_setup(card)
+            card.setStyleSheet(LEGACY_CARD_STYLE)
+            card.lblPersona.setStyleSheet("font-size: 20px; font-weight: bold;")
+            card.lblAccount.setStyleSheet("font-size: 16px; color: #66c0f4;")
+
+        launcher.ProfileCard.setup_ui = legacy_setup
+        results.append(measure(f"ProfileSelectionPage ({args.profiles} cards, per-card style)", build_profiles,
+                               args.repeat))
+        launcher.ProfileCard.setup_ui = original_setup
+
+        games = [{"name": game_name(i), "exe": None, "update": i % 10 == 0, "appid": str(100000 + i),
+                  "path": os.path.join(steam, "steamapps", "common", f"game_{i:05d}")} for i in range(args.games)]
+        home = launcher.HomePage(os.path.join(steam, "steamapps", "common"), {"PersonaName": "Benchmark"})
+        home.resize(1280, 720)
+        home.show()
+        deadline = time.monotonic() + 5
+        while (home.scan_worker is None or home.scan_worker.isRunning()) and time.monotonic() < deadline:
+            app.processEvents()
+        app.processEvents()
+        home.load_games(games)
+        view = home.games_view
+        scrollbar = view.verticalScrollBar()
+        # Un premier passage décode toutes les jaquettes : les mesures ne portent que sur le rendu
+        for value in range(0, scrollbar.maximum() + 1, view.viewport().height()):
+            scrollbar.setValue(value)
+            home.prefetch_thumbnails()
+            home.thumbnails.pool.waitForDone()
+            app.processEvents()
+
+        def scroll_run(name):
+            scrollbar.setValue(0)
+            app.processEvents()
+            view.frame_times.clear()
+            for frame in range(args.frames):
+                scrollbar.setValue(frame * args.step % (scrollbar.maximum() + 1))
+                # Le curseur balaie la grille pour déclencher les fondus de survol pendant le défilement
+                pos = QtCore.QPoint(40 + frame * 37 % (view.viewport().width() - 80), view.viewport().height() // 2)
+                app.sendEvent(view.viewport(), QtGui.QMouseEvent(QtCore.QEvent.MouseMove, pos, QtCore.Qt.NoButton,
+                                                                 QtCore.Qt.NoButton, QtCore.Qt.NoModifier))
+                view.viewport().repaint()
+                app.processEvents()
+            return frame_stats(name, list(view.frame_times))
+
+        results.append(scroll_run(f"grid scroll ({args.games} games, animations on)"))
+        launcher.ANIMATIONS.set_enabled(False)
+        results.append(scroll_run(f"grid scroll ({args.games} games, animations off)"))
+        launcher.ANIMATIONS.set_enabled(True)
+        results.append({"name": "hover animations allocated", "count": launcher.ANIMATIONS.created})
+        print(f"{'hover animations allocated':<45} {launcher.ANIMATIONS.created}", file=sys.stderr)
+        home.release()
+        home.close()
+
+    report = {
+        "version": 1,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt": QtCore.QT_VERSION_STR,
+        "parameters": vars(args),
+        "results": results
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    sys.exit(main())
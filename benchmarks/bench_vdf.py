@@ -0,0 +1,93 @@
+import argparse, os, re, sys, tempfile, time
+from synthetic import load_launcher, write_appinfo, write_localconfig, write_loginusers
+
+# Ancienne implémentation (regex ligne par ligne), gardée ici comme référence
+def legacy_parse_loginusers_vdf(filepath):
+    profiles = []
+    current_user = {}
+    in_user_block = False
+    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            line = line.strip()
+            if re.match(r'^"\d{17}"$', line):
+                if current_user:
+                    profiles.append(current_user)
+                current_user = {'SteamID': line.strip('"')}
+                in_user_block = True
+            elif in_user_block and '"' in line:
+                parts = re.findall(r'"([^"]+)"', line)
+                if len(parts) >= 2:
+                    key, value = parts[0], parts[1]
+                    if key == "AccountName":
+                        current_user["AccountName"] = value
+                    elif key == "PersonaName":
+                        current_user["PersonaName"] = value
+            elif line == '}':
+                in_user_block = False
+        if current_user:
+            profiles.append(current_user)
+    return profiles
+
+def timed(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the KeyValues parsers of Steam Simple")
+    parser.add_argument("--profiles", type=int, default=5000)
+    parser.add_argument("--apps", type=int, default=50000)
+    parser.add_argument("--played", type=int, default=2000, help="apps listed in localconfig.vdf")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    launcher = load_launcher()
+    with tempfile.TemporaryDirectory() as tmp:
+        loginusers = os.path.join(tmp, "loginusers.vdf")
+        appinfo = os.path.join(tmp, "appinfo.vdf")
+        write_loginusers(loginusers, args.profiles)
+        write_appinfo(appinfo, args.apps)
+        userdata = os.path.join(tmp, "userdata")
+        account = {"SteamID": str(launcher.STEAM_ID64_BASE + 1)}
+        localconfig = os.path.join(userdata, "1", "config", "localconfig.vdf")
+        os.makedirs(os.path.dirname(localconfig))
+        write_localconfig(localconfig, args.played)
+        store = launcher.ProfileMetadataStore(userdata)
+        store.get(account)
+        assert legacy_parse_loginusers_vdf(loginusers) == launcher.parse_loginusers_vdf(loginusers)
+        target = args.apps // 2
+
+        def full_decode():
+            with launcher.AppInfoReader(appinfo) as reader:
+                for appid in reader:
+                    reader.get(appid)
+
+        def lazy_lookup():
+            with launcher.AppInfoReader(appinfo) as reader:
+                reader.get(target)
+
+        results = [
+            (f"loginusers.vdf, {args.profiles} profiles, legacy regex",
+             timed(lambda: legacy_parse_loginusers_vdf(loginusers), args.repeat)),
+            (f"loginusers.vdf, {args.profiles} profiles, KeyValues tokenizer",
+             timed(lambda: launcher.parse_loginusers_vdf(loginusers), args.repeat)),
+            (f"appinfo.vdf ({os.path.getsize(appinfo) >> 20} MB), decode every app",
+             timed(full_decode, max(1, args.repeat // 2))),
+            ("appinfo.vdf, open + lookup of a single app",
+             timed(lazy_lookup, args.repeat)),
+            (f"localconfig.vdf ({os.path.getsize(localconfig) >> 10} KB), full tree",
+             timed(lambda: launcher.load_vdf(localconfig), args.repeat)),
+            ("localconfig.vdf, apps + collections only",
+             timed(lambda: launcher.parse_localconfig(localconfig), args.repeat)),
+            ("localconfig.vdf, profile switch (unchanged file)",
+             timed(lambda: store.get(account), args.repeat)),
+        ]
+    width = max(len(name) for name, _ in results)
+    for name, ms in results:
+        print(f"{name:<{width}}  {ms:10.2f} ms")
+
+if __name__ == "__main__":
+    sys.exit(main())
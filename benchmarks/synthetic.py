@@ -0,0 +1,90 @@
+import importlib.util, os, struct
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SteamSimple-1.0.py")
+
+def load_launcher():
+    spec = importlib.util.spec_from_file_location("steamsimple", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def write_loginusers(path, profiles):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('"users"\n{\n')
+        for i in range(profiles):
+            f.write(f'\t"{76561198000000000 + i}"\n\t{{\n'
+                    f'\t\t"AccountName"\t\t"account{i}"\n'
+                    f'\t\t"PersonaName"\t\t"Player {i}"\n'
+                    f'\t\t"RememberPassword"\t\t"1"\n'
+                    f'\t\t"MostRecent"\t\t"{int(i == 0)}"\n'
+                    f'\t\t"Timestamp"\t\t"1700000000"\n\t}}\n')
+        f.write('}\n')
+
+def _cstring(text):
+    return text.encode("utf-8") + b"\0"
+
+def write_appinfo(path, apps):
+    with open(path, "wb") as f:
+        f.write(struct.pack("<II", 0x07564428, 1))
+        for appid in range(1, apps + 1):
+            blob = (b"\x00" + _cstring("appinfo")
+                    + b"\x02" + _cstring("appid") + struct.pack("<i", appid)
+                    + b"\x00" + _cstring("common")
+                    + b"\x01" + _cstring("name") + _cstring(f"Synthetic App {appid}")
+                    + b"\x01" + _cstring("type") + _cstring("Game")
+                    + b"\x00" + _cstring("depots")
+                    + b"".join(b"\x01" + _cstring(str(d)) + _cstring("x" * 64) for d in range(20))
+                    + b"\x08\x08\x08\x08")
+            header = struct.pack("<IIQ", 2, 1700000000, 0) + b"\0" * 20 + struct.pack("<I", appid) + b"\0" * 20
+            f.write(struct.pack("<II", appid, len(header) + len(blob)) + header + blob)
+        f.write(struct.pack("<I", 0))
+
+def write_localconfig(path, apps, friends=2000):
+    # Structure d'un localconfig.vdf réel : beaucoup de blocs sans intérêt autour des apps et des collections
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('"UserLocalConfigStore"\n{\n\t"friends"\n\t{\n')
+        for i in range(friends):
+            f.write(f'\t\t"{10000 + i}"\n\t\t{{\n\t\t\t"name"\t\t"Friend {i}"\n'
+                    f'\t\t\t"NameHistory"\n\t\t\t{{\n\t\t\t\t"0"\t\t"Old name {i}"\n\t\t\t}}\n\t\t}}\n')
+        f.write('\t}\n\t"Software"\n\t{\n\t\t"Valve"\n\t\t{\n\t\t\t"Steam"\n\t\t\t{\n\t\t\t\t"apps"\n\t\t\t\t{\n')
+        for appid in range(1, apps + 1):
+            f.write(f'\t\t\t\t\t"{appid}"\n\t\t\t\t\t{{\n'
+                    f'\t\t\t\t\t\t"LastPlayed"\t\t"{1600000000 + appid * 97 % 100000000}"\n'
+                    f'\t\t\t\t\t\t"Playtime"\t\t"{appid * 13 % 5000}"\n'
+                    f'\t\t\t\t\t\t"cloud"\n\t\t\t\t\t\t{{\n\t\t\t\t\t\t\t"last_sync_state"\t\t"synchronized"\n'
+                    f'\t\t\t\t\t\t}}\n\t\t\t\t\t}}\n')
+        favorites = ",".join(str(appid) for appid in range(1, apps + 1, 10))
+        collections = '{\\"favorite\\":{\\"id\\":\\"favorite\\",\\"added\\":[' + favorites + '],\\"removed\\":[]}}'
+        f.write(f'\t\t\t\t}}\n\t\t\t}}\n\t\t}}\n\t}}\n\t"WebStorage"\n\t{{\n'
+                f'\t\t"user-collections"\t\t"{collections}"\n\t}}\n}}\n')
+
+GAME_WORDS = ["Half", "Life", "Counter", "Strike", "Portal", "Dark", "Souls", "Elden", "Ring",
+              "Witcher", "Cyberpunk", "Total", "War", "Age", "Empires", "Stardew", "Valley", "Hades"]
+
+def game_name(i):
+    return f"{GAME_WORDS[i % len(GAME_WORDS)]} {GAME_WORDS[(i * 7 + 3) % len(GAME_WORDS)]} {i}"
+
+def make_library(root, games, depth=3, files=20, manifest_ratio=1.0):
+    # steamapps/common/<jeu>/d0/d1/.../game.exe, avec `files` fichiers par niveau
+    steamapps = os.path.join(root, "steamapps")
+    common = os.path.join(steamapps, "common")
+    os.makedirs(common, exist_ok=True)
+    with_manifest = int(games * manifest_ratio)
+    for i in range(games):
+        installdir = f"game_{i:05d}"
+        folder = os.path.join(common, installdir)
+        for level in range(depth + 1):
+            os.makedirs(folder, exist_ok=True)
+            for j in range(files):
+                open(os.path.join(folder, f"asset_{j:03d}.pak"), "wb").close()
+            if level < depth:
+                folder = os.path.join(folder, f"d{level}")
+        with open(os.path.join(folder, f"game_{i}.exe"), "wb") as f:
+            f.write(b"MZ" + b"\0" * 1022)
+        if i < with_manifest:
+            with open(os.path.join(steamapps, f"appmanifest_{100000 + i}.acf"), "w", encoding="utf-8") as f:
+                f.write(f'"AppState"\n{{\n\t"appid"\t\t"{100000 + i}"\n\t"Universe"\t\t"1"\n'
+                        f'\t"name"\t\t"{game_name(i)}"\n\t"StateFlags"\t\t"{6 if i % 10 == 0 else 4}"\n'
+                        f'\t"installdir"\t\t"{installdir}"\n\t"SizeOnDisk"\t\t"{1024 * (i + 1)}"\n'
+                        f'\t"UserConfig"\n\t{{\n\t\t"language"\t\t"english"\n\t}}\n}}\n')
+    return common